@@ -24,6 +24,9 @@ const SPECIAL_SHOWS_MAX_DAYS = 7;
 
 let organizedDataCache = {};
 let specialShowsCache = [];
+// Manifest of the per-day bundle built by the scraper; null when using data.json
+let bundleManifest = null;
+const loadedDays = new Set();
 
 // Identify special shows: limited days OR non-consecutive days, first day >= tomorrow
 function identifySpecialShows(movies) {
@@ -805,7 +808,7 @@ function displayMoviesByDate(data) {
         }
     });
 
-    if (!availableDates.length && !specialShowsCache.length) {
+    if (!availableDates.length && !specialShowsCache.length && !hasUnloadedDays()) {
         const emptyState = document.createElement('p');
         emptyState.className = 'empty-state';
         emptyState.textContent = 'No movies to show right now. Refresh the page to restore the list.';
@@ -1105,6 +1108,11 @@ function createDayLinks(data, preferredDay, orderedDates, options = {}) {
 
 function showMoviesForDay(selectedDay, options = {}) {
     const { preserveScrollPosition = false } = options;
+    // Fetch the day's shard on first view, then render again with it
+    if (bundleManifest && !loadedDays.has(selectedDay)) {
+        loadDay(selectedDay).then(() => renderApp(selectedDay, options));
+        return;
+    }
     // Find all day sections
     const allDays = document.querySelectorAll('#movies > div');
     allDays.forEach(daySection => {
@@ -1154,21 +1162,73 @@ function showSpecialShows() {
     }, 100);
 }
 
-// Assuming `organizedData` is your data object from the previous example
-fetch('data.json')
-  .then(response => response.json())
-  .then(data => {
-    organizedDataCache = reorganizeDataByDate(data);
-    specialShowsCache = identifySpecialShows(data);
-    renderApp();
-  })
-  .catch(error => console.error('Error loading the movie data:', error));
+function fetchJson(url) {
+    return fetch(url).then(response => {
+        if (!response.ok) {
+            throw new Error(`HTTP ${response.status} for ${url}`);
+        }
+        return response.json();
+    });
+}
+
+function fetchBundleFile(file) {
+    return fetchJson(`bundle/${file}?v=${bundleManifest.version}`);
+}
+
+function hasUnloadedDays() {
+    return Boolean(bundleManifest) && bundleManifest.dates.some(day => !loadedDays.has(day));
+}
+
+// Load one day's precomputed shard into the date index
+function loadDay(day) {
+    return fetchBundleFile(bundleManifest.days[day].file)
+        .catch(error => {
+            console.error(`Error loading movies for ${day}:`, error);
+            return [];
+        })
+        .then(movies => {
+            loadedDays.add(day);
+            if (movies.length) {
+                organizedDataCache[day] = movies;
+            }
+        });
+}
+
+// Fallback: download the whole data.json and index it in the browser
+function loadFullData() {
+    bundleManifest = null;
+    return fetchJson('data.json')
+        .then(data => {
+            organizedDataCache = reorganizeDataByDate(data);
+            specialShowsCache = identifySpecialShows(data);
+            renderApp();
+        })
+        .catch(error => console.error('Error loading the movie data:', error));
+}
+
+// Load the manifest and special shows; day shards are fetched when selected
+fetchJson('bundle/manifest.json')
+    .then(manifest => {
+        bundleManifest = manifest;
+        return fetchBundleFile(manifest.special_shows);
+    })
+    .then(specialShows => {
+        // Precomputed candidates; only the date-dependent check runs here
+        specialShowsCache = identifySpecialShows(specialShows);
+        renderApp();
+    })
+    .catch(error => {
+        console.warn('Bundle unavailable, loading data.json:', error);
+        loadFullData();
+    });
 
 function renderApp(preferredDay, options = {}) {
     const { preserveScrollPosition = false } = options;
     const filteredData = filterDismissedMovies(organizedDataCache);
     const availableDates = displayMoviesByDate(filteredData);
-    createDayLinks(filteredData, preferredDay, availableDates, { preserveScrollPosition });
+    // Days not fetched yet still get a link so they can be loaded on demand
+    const unloadedDates = bundleManifest ? bundleManifest.dates.filter(day => !loadedDays.has(day)) : [];
+    createDayLinks(filteredData, preferredDay, availableDates.concat(unloadedDates), { preserveScrollPosition });
 }
 
 // Function to set the full height variable
@@ -0,0 +1,336 @@
+"""Fetcher/parser backends used by the scraper before falling back to Selenium."""
+import json
+import logging
+import re
+from urllib.parse import urljoin
+
+import requests
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from retry import host_health, parse_retry_after
+from telemetry import tracer
+
+
+USER_AGENT = ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+              '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+
+HTTP_TIMEOUT_SECONDS = 15
+HTTP_POOL_SIZE = 10
+
+ISO_DURATION = re.compile(r'^PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?$')
+
+
+class HttpFetcher:
+    """A pooled `requests.Session` with the same user agent as the browser."""
+
+    def __init__(self, pool_size=HTTP_POOL_SIZE, timeout=HTTP_TIMEOUT_SECONDS):
+        self.logger = logging.getLogger(__name__)
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': USER_AGENT,
+            'Accept-Language': 'es-AR,es;q=0.9,en;q=0.8',
+        })
+        # Only connection errors are retried here. Error statuses such as 503 reach the caller with
+        # their response, so the host's health sees them and their Retry-After (see retry.py).
+        retry = Retry(total=2, backoff_factor=0.5, allowed_methods=('GET', 'HEAD'), respect_retry_after_header=False)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def get(self, url, headers=None):
+        response = self.session.get(url, headers=headers, timeout=self.timeout)
+        response.raise_for_status()
+        return response
+
+    def get_text(self, url, headers=None):
+        """The body of `url`, or None when it could not be fetched, recording the host's HTTP health.
+
+        Skips the request while the host's HTTP circuit is open.
+        """
+        health = host_health.get(url, transport='http')
+        if health.is_open():
+            return None
+        try:
+            tracer.count('http_requests', url)
+            with tracer.span('http.get', url=url):
+                response = self.get(url, headers=headers)
+        except requests.RequestException as exc:
+            self.logger.warning("HTTP fetch failed for %s: %s", url, exc)
+            retry_after = exc.response.headers.get('Retry-After') if exc.response is not None else None
+            health.record_failure(parse_retry_after(retry_after))
+            return None
+        health.record_success()
+        return response.text
+
+    def close(self):
+        self.session.close()
+
+
+def _text(element):
+    return element.get_text(' ', strip=True) if element is not None else ''
+
+
+def parse_listing_hrefs(html, base_url, listing_selector):
+    """Extract the absolute movie hrefs of a cinema's `cartelera_cine_*` block."""
+    soup = BeautifulSoup(html, 'html.parser')
+    return [urljoin(base_url, link['href']) for link in soup.select(listing_selector) if link.get('href')]
+
+
+def parse_showtimes_grid(soup):
+    """Parse the currently rendered `.op_format` grid into {format: [times]}."""
+    grid = {}
+    for format_element in soup.select('.op_format'):
+        format_type = format_element.decode_contents().strip()
+        time_container = format_element.find_next_sibling('div')
+        if time_container is None:
+            continue
+        grid[format_type] = [button.decode_contents().strip()
+                             for button in time_container.select('button.op_perf')]
+    return grid
+
+
+def parse_movie_page(html, url):
+    """Parse a server-rendered Showcase movie page fetched from `url`.
+
+    Returns a dict with the raw (not yet normalized) title, absolute poster
+    URL, original title, duration, director and showing days. `showtimes` holds the grid when
+    the static HTML is enough to build it (a single showing day), otherwise
+    None so the caller can load the per-day AJAX data in a browser. Returns
+    None when any of the fields the Selenium path requires is missing.
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+
+    title = soup.select_one('.movie-info-box .name > strong')
+    poster = soup.select_one('.movie-side-info-box figure > img')
+    original_title = soup.select_one('.movie-side-info-box ul > li:first-of-type')
+    duration = soup.select_one('.movie-info-box ul.features .year')
+    if (title is None or poster is None or not poster.get('src')
+            or original_title is None or duration is None or not soup.select('.op_format')):
+        return None
+
+    director = ''
+    for li in soup.select('.movie-side-info-box ul > li'):
+        text = _text(li)
+        if 'Director:' in text:
+            director = text.replace('Director:', '').strip()
+            break
+
+    showing_days = [button.get('value') for button in soup.select('.movie-info-box .op_days > button')]
+    day_values = [button.get('value') for button in
+                  soup.select('.movie-info-box #op_container .op_days .op_day')]
+
+    showtimes = None
+    if not day_values:
+        showtimes = {}
+    elif len(day_values) == 1:
+        showtimes = {day_values[0]: parse_showtimes_grid(soup)}
+
+    return {
+        'title': _text(title),
+        'original_title': _text(original_title).replace('Título Original: ', ''),
+        # Resolved like the browser's `img.src`, so relative posters still load from the frontend.
+        'poster_url': urljoin(url, poster.get('src')),
+        'duration': _text(duration),
+        'director': director,
+        'showing_days': showing_days,
+        'showtimes': showtimes,
+    }
+
+
+def parse_showtimes_probe(html):
+    """Read only the showing days and the statically rendered grid of a Showcase movie page.
+
+    Returns {'showing_days', 'showtimes', 'complete'}: `showtimes` holds the
+    grid of the first day only, and `complete` tells whether that is every
+    day of the page. Returns None when the page has no showtimes markup.
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    if not soup.select('.movie-info-box .op_days'):
+        return None
+    showing_days = [button.get('value') for button in soup.select('.movie-info-box .op_days > button')]
+    day_values = [button.get('value') for button in
+                  soup.select('.movie-info-box #op_container .op_days .op_day')]
+    return {
+        'showing_days': showing_days,
+        'showtimes': {day_values[0]: parse_showtimes_grid(soup)} if day_values else {},
+        'complete': len(day_values) <= 1,
+    }
+
+
+def format_imdb_duration(minutes):
+    """Format minutes the way IMDb title pages do: '2h 50m', '2h' or '45m'."""
+    hours, minutes = divmod(minutes, 60)
+    return " ".join(part for part in (f"{hours}h" if hours else "", f"{minutes}m" if minutes else "") if part)
+
+
+def _dig(data, *keys):
+    for key in keys:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
+def _iso_duration_minutes(value):
+    match = ISO_DURATION.match(value or '')
+    if not match or not any(match.groups()):
+        return None
+    hours, minutes, seconds = (int(group or 0) for group in match.groups())
+    return hours * 60 + minutes + seconds // 60
+
+
+def _above_the_fold(soup):
+    """The `aboveTheFoldData` of a title page's `__NEXT_DATA__` blob, or {}."""
+    next_data = soup.find('script', id='__NEXT_DATA__')
+    if next_data is None or not next_data.string:
+        return {}
+    try:
+        return _dig(json.loads(next_data.string), 'props', 'pageProps', 'aboveTheFoldData') or {}
+    except json.JSONDecodeError:
+        return {}
+
+
+def _json_ld(soup):
+    """The JSON-LD objects of a page, skipping blocks that do not parse."""
+    blocks = []
+    for script in soup.find_all('script', type='application/ld+json'):
+        try:
+            data = json.loads(script.string or '')
+        except json.JSONDecodeError:
+            continue
+        if isinstance(data, dict):
+            blocks.append(data)
+    return blocks
+
+
+def parse_imdb_title_page(html):
+    """Read rating, Metascore and runtime from an IMDb title page's embedded data.
+
+    Uses the `__NEXT_DATA__` blob, falling back to the JSON-LD block for rating
+    and runtime (it has no Metascore). Returns only the fields found, formatted
+    like the DOM scrape: {'imdb_rating': '7.3', 'metascore': '74', 'imdb_duration': '2h 50m'}.
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    above_the_fold = _above_the_fold(soup)
+    rating = _dig(above_the_fold, 'ratingsSummary', 'aggregateRating')
+    metascore = _dig(above_the_fold, 'metacritic', 'metascore', 'score')
+    seconds = _dig(above_the_fold, 'runtime', 'seconds')
+    minutes = seconds // 60 if isinstance(seconds, int) else None
+
+    if rating is None or minutes is None:
+        for data in _json_ld(soup):
+            if rating is None:
+                rating = _dig(data, 'aggregateRating', 'ratingValue')
+            if minutes is None:
+                minutes = _iso_duration_minutes(data.get('duration'))
+
+    fields = {}
+    if rating is not None:
+        fields['imdb_rating'] = f"{float(rating):.1f}"
+    if metascore is not None:
+        fields['metascore'] = str(metascore)
+    if minutes:
+        fields['imdb_duration'] = format_imdb_duration(minutes)
+    return fields
+
+
+def parse_imdb_title_details(html):
+    """Read directors, runtime (minutes) and year from an IMDb title page's embedded data.
+
+    Used to settle close calls between search candidates; returns None when
+    the page has neither `__NEXT_DATA__` nor JSON-LD.
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    details = None
+
+    above_the_fold = _above_the_fold(soup)
+    if above_the_fold:
+        directors = [_dig(credit, 'name', 'nameText', 'text')
+                     for group in above_the_fold.get('directorsPageTitle') or []
+                     for credit in group.get('credits') or []]
+        seconds = _dig(above_the_fold, 'runtime', 'seconds')
+        details = {
+            'directors': [name for name in directors if name],
+            'runtime': seconds // 60 if isinstance(seconds, int) else None,
+            'year': _dig(above_the_fold, 'releaseYear', 'year'),
+        }
+
+    if details is None or not details['directors']:
+        for data in _json_ld(soup):
+            people = data.get('director') or []
+            published = str(data.get('datePublished') or '')
+            details = {
+                'directors': [person.get('name') for person in
+                              (people if isinstance(people, list) else [people]) if person.get('name')],
+                'runtime': (details or {}).get('runtime') or _iso_duration_minutes(data.get('duration')),
+                'year': (details or {}).get('year') or (int(published[:4]) if published[:4].isdigit() else None),
+            }
+            break
+    return details
+
+
+class HttpMovieBackend:
+    """Fetch Showcase movie pages over HTTP and parse them without a browser."""
+
+    name = 'http'
+
+    def __init__(self, fetcher=None):
+        self.logger = logging.getLogger(__name__)
+        self.fetcher = fetcher or HttpFetcher()
+
+    def fetch_movie(self, href):
+        """Return the parsed movie page, or None if the browser is needed for the whole page."""
+        html = self.fetcher.get_text(href)
+        if html is None:
+            return None
+        with tracer.span('http.parse'):
+            page = parse_movie_page(html, href)
+        if page is None:
+            self.logger.info("Static HTML incomplete for %s, falling back to Selenium", href)
+        return page
+
+    def probe_showtimes(self, href):
+        """Return the showing days and static grid of a movie page (see parse_showtimes_probe), or None."""
+        html = self.fetcher.get_text(href)
+        if html is None:
+            return None
+        with tracer.span('http.parse'):
+            return parse_showtimes_probe(html)
+
+    def close(self):
+        self.fetcher.close()
+
+
+class HttpImdbBackend:
+    """Fetch IMDb title pages over HTTP and read their embedded rating data."""
+
+    name = 'http'
+
+    def __init__(self, fetcher=None):
+        self.logger = logging.getLogger(__name__)
+        self.fetcher = fetcher or HttpFetcher()
+
+    def fetch_title(self, url):
+        """Return the fields parsed from a title page, or None if it could not be fetched."""
+        html = self._fetch(url)
+        if html is None:
+            return None
+        with tracer.span('http.parse'):
+            return parse_imdb_title_page(html)
+
+    def fetch_details(self, url):
+        """Return the directors, runtime and year of a title page, or None."""
+        html = self._fetch(url)
+        if html is None:
+            return None
+        with tracer.span('http.parse'):
+            return parse_imdb_title_details(html)
+
+    def _fetch(self, url):
+        return self.fetcher.get_text(url, headers={'Accept-Language': 'en-US,en;q=0.9'})
+
+    def close(self):
+        self.fetcher.close()
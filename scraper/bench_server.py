@@ -0,0 +1,268 @@
+"""Local stand-in for todoshowcase.com and imdb.com used by the benchmark.
+
+Serves a synthetic listing, movie pages with `.op_days`/`.op_format` markup and
+a per-day AJAX endpoint, IMDb find pages and IMDb title pages (with their
+JSON-LD and `__NEXT_DATA__` blobs), sized by films x days x formats, with
+configurable latency and failure injection.
+Pages recorded from the real sites can be served instead of the synthetic ones
+by dropping them in a fixtures directory (see `fixture_name`).
+
+    python scraper/bench_server.py --films 30 --days 7 --formats 3 --latency-ms 50
+"""
+import argparse
+import html
+import json
+import random
+import re
+import threading
+import time
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+
+FORMATS = ('2D-Castellano', '2D-Subtitulado', '3D-Castellano', '3D-Subtitulado', '4D-Castellano', 'IMAX-Subtitulado')
+CINEMA_ID = '40212'
+HOUSE_ID = '3206'
+
+
+class Catalog:
+    """Deterministic synthetic films for a given size."""
+
+    def __init__(self, films=30, days=7, formats=3, times=6, start=None, seed=0):
+        rng = random.Random(seed)
+        start = start or date.today()
+        self.days = [(start + timedelta(days=offset)).isoformat() for offset in range(days)]
+        self.films = []
+        for index in range(films):
+            film_id = 5000 + index
+            minutes = rng.randint(85, 180)
+            self.films.append({
+                'id': str(film_id),
+                'title': f'Película Número {index + 1}',
+                'original_title': f'Benchmark Film {index + 1}',
+                'director': f'Director{index + 1} Apellido{index + 1}',
+                'minutes': minutes,
+                'imdb_id': f'tt{9000000 + index}',
+                'rating': f'{rng.uniform(4, 9):.1f}',
+                'metascore': str(rng.randint(30, 95)),
+                'formats': list(FORMATS[:formats]),
+                'times': sorted(f'{rng.randint(12, 23):02d}:{rng.choice((0, 15, 30, 45)):02d}' for _ in range(times)),
+            })
+        self.by_id = {film['id']: film for film in self.films}
+        self.by_title = {film['original_title'].lower(): film for film in self.films}
+        self.by_imdb_id = {film['imdb_id']: film for film in self.films}
+
+
+def _grid(film):
+    rows = []
+    for format_type in film['formats']:
+        buttons = ''.join(f'<button class="op_perf">{time_}</button>' for time_ in film['times'])
+        rows.append(f'<div class="op_row"><span class="op_format">{format_type}</span><div>{buttons}</div></div>')
+    return ''.join(rows)
+
+
+DAY_SCRIPT = """
+<script>
+document.querySelectorAll('.op_day').forEach(function (button) {
+  button.addEventListener('click', function () {
+    fetch('/showcase/funciones?filmid=' + button.dataset.film + '&day=' + button.value)
+      .then(function (response) { return response.text(); })
+      .then(function (grid) { document.getElementById('op_grid').innerHTML = grid; });
+  });
+});
+</script>
+"""
+
+
+def listing_page(catalog):
+    films = ''.join(
+        f'<div class="boxfilm"><div class="afiche-pelicula">'
+        f'<a href="/showcase/pelicula?filmid={film["id"]}&house_id={HOUSE_ID}">{html.escape(film["title"])}</a>'
+        f'</div></div>'
+        for film in catalog.films
+    )
+    return f'<html><body><div id="cartelera_cine_{CINEMA_ID}">{films}</div></body></html>'
+
+
+def movie_page(catalog, film):
+    days = ''.join(f'<button class="op_day" value="{day}" data-film="{film["id"]}">{day}</button>'
+                   for day in catalog.days)
+    return f"""<html><body>
+<div class="movie-info-box">
+  <div class="name"><strong>{html.escape(film['title'].upper())}</strong></div>
+  <ul class="features"><li class="year">{film['minutes']} minutos.</li></ul>
+  <div id="op_container"><div class="op_days">{days}</div><div id="op_grid">{_grid(film)}</div></div>
+</div>
+<div class="movie-side-info-box">
+  <figure><img src="/posters/{film['id']}.jpg"></figure>
+  <ul><li>Título Original: {html.escape(film['original_title'])}</li><li>Director: {html.escape(film['director'])}</li></ul>
+</div>
+{DAY_SCRIPT}
+</body></html>"""
+
+
+def imdb_find_page(catalog, query):
+    film = catalog.by_title.get(query.strip().lower())
+    items = ''
+    if film is not None:
+        items = (f'<li class="ipc-metadata-list-summary-item"><a href="/title/{film["imdb_id"]}/?ref_=fn_tt">'
+                 f'<h3>{html.escape(film["original_title"])}</h3></a></li>')
+    return (f'<html><body><section data-testid="find-results-section-title"><ul>{items}</ul></section>'
+            f'</body></html>')
+
+
+def imdb_title_page(film):
+    hours, minutes = divmod(film['minutes'], 60)
+    next_data = json.dumps({'props': {'pageProps': {'aboveTheFoldData': {
+        'ratingsSummary': {'aggregateRating': float(film['rating'])},
+        'metacritic': {'metascore': {'score': int(film['metascore'])}},
+        'runtime': {'seconds': film['minutes'] * 60},
+    }}}})
+    json_ld = json.dumps({'@type': 'Movie', 'name': film['original_title'],
+                          'aggregateRating': {'ratingValue': float(film['rating'])},
+                          'duration': f"PT{hours}H{minutes}M"})
+    return f"""<html><head>
+<script type="application/ld+json">{json_ld}</script>
+<script id="__NEXT_DATA__" type="application/json">{next_data}</script>
+</head><body><main>
+<h1 data-testid="hero__pageTitle">{html.escape(film['original_title'])}</h1>
+<ul role="presentation"><li>2025</li><li>PG-13</li><li>{hours}h {minutes}m</li></ul>
+<div data-testid="hero-rating-bar__aggregate-rating__score"><span>{film['rating']}</span><span>/10</span></div>
+<span class="metacritic-score-box">{film['metascore']}</span>
+<section>Director {html.escape(film['director'])}</section>
+</main></body></html>"""
+
+
+def fixture_name(path, query):
+    """File name under the fixtures directory for a request path and query."""
+    name = re.sub(r'[^A-Za-z0-9._-]+', '_', f'{path}?{query}' if query else path).strip('_')
+    return (name or 'index') + '.html'
+
+
+class StandInServer:
+    """A threaded HTTP server serving the catalog, with latency and failure injection."""
+
+    def __init__(self, catalog, host='127.0.0.1', port=0, latency_ms=0, jitter_ms=0,
+                 failure_rate=0.0, fixtures_dir=None, seed=0):
+        self.catalog = catalog
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.failure_rate = failure_rate
+        self.fixtures_dir = Path(fixtures_dir) if fixtures_dir else None
+        self.requests = 0
+        self.failures = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def _delay_and_fail(self):
+        """Sleep for the configured latency; return True if this request should fail."""
+        with self._lock:
+            self.requests += 1
+            delay = self.latency_ms + self._rng.uniform(0, self.jitter_ms)
+            fail = self._rng.random() < self.failure_rate
+            if fail:
+                self.failures += 1
+        if delay:
+            time.sleep(delay / 1000)
+        return fail
+
+    def route(self, path, query):
+        """Return (status, body) for a request."""
+        if self.fixtures_dir is not None:
+            fixture = self.fixtures_dir / fixture_name(path, query)
+            if fixture.exists():
+                return 200, fixture.read_text(encoding='utf-8')
+
+        params = parse_qs(query)
+        if path == '/':
+            return 200, listing_page(self.catalog)
+        if path == '/showcase/pelicula':
+            film = self.catalog.by_id.get(params.get('filmid', [''])[0])
+            return (200, movie_page(self.catalog, film)) if film else (404, 'not found')
+        if path == '/showcase/funciones':
+            film = self.catalog.by_id.get(params.get('filmid', [''])[0])
+            return (200, _grid(film)) if film else (404, 'not found')
+        if path.startswith('/posters/'):
+            return 200, ''
+        if path == '/find/':
+            return 200, imdb_find_page(self.catalog, params.get('q', [''])[0])
+        match = re.match(r'^/title/(tt\d+)/?$', path)
+        if match:
+            film = self.catalog.by_imdb_id.get(match.group(1))
+            return (200, imdb_title_page(film)) if film else (404, 'not found')
+        return 404, 'not found'
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if server._delay_and_fail():
+                    status, body = 503, 'injected failure'
+                else:
+                    parsed = urlparse(self.path)
+                    status, body = server.route(parsed.path, parsed.query)
+                payload = body.encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(payload)))
+                if status == 503:
+                    self.send_header('Retry-After', '1')
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def add_catalog_arguments(parser):
+    parser.add_argument('--films', type=int, default=30, help='Number of films in the listing.')
+    parser.add_argument('--days', type=int, default=7, help='Showing days per film.')
+    parser.add_argument('--formats', type=int, default=3, help=f'Formats per day (max {len(FORMATS)}).')
+    parser.add_argument('--times', type=int, default=6, help='Showtimes per format.')
+    parser.add_argument('--latency-ms', type=float, default=0, help='Added latency per request.')
+    parser.add_argument('--jitter-ms', type=float, default=0, help='Random extra latency per request.')
+    parser.add_argument('--failure-rate', type=float, default=0.0, help='Fraction of requests answered with 503.')
+    parser.add_argument('--fixtures-dir', type=str, help='Directory of recorded pages served instead of synthetic ones.')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for the synthetic data and failures.')
+
+
+def server_from_args(args, port=0):
+    catalog = Catalog(films=args.films, days=args.days, formats=args.formats, times=args.times, seed=args.seed)
+    return StandInServer(catalog, port=port, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+                         failure_rate=args.failure_rate, fixtures_dir=args.fixtures_dir, seed=args.seed)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Serve a local Showcase/IMDb stand-in.')
+    add_catalog_arguments(parser)
+    parser.add_argument('--port', type=int, default=8000)
+    args = parser.parse_args()
+
+    server = server_from_args(args, port=args.port)
+    print(f"Serving {args.films} films x {args.days} days x {args.formats} formats on {server.base_url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
@@ -0,0 +1,151 @@
+"""Offline benchmark for the scraper, run against the local stand-in server.
+
+Times `run_light_scraping` and `run_heavy_scraping` end to end and a few hot
+helpers, and writes the results as JSON so runs can be compared over time.
+Output files (data.json, bundle, fingerprint) go to a temporary directory;
+nothing under docs/ is touched. The end-to-end runs need Chrome for the IMDb
+lookups and for multi-day showtime grids.
+
+    python scraper/benchmark.py --films 30 --days 7 --formats 3 --latency-ms 50 --output bench.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import logging
+import platform
+import sys
+import tempfile
+import time
+import timeit
+from pathlib import Path
+
+import scraper
+from bench_server import add_catalog_arguments, server_from_args
+from browser_profile import BrowserProfile
+
+
+MICRO_TITLES = ['ÁNgelo y el MISTERIO de la BTS', "l'été DERNIER", 'Avatar: Fuego Y Ceniza', 'IMAX 3D: LA ODISEA']
+MICRO_DURATIONS = ['2h 50m', '1h 5m', '45m', '3h']
+
+
+def bench_micro(number, repeat):
+    """Time the hot helpers; returns {name: {iterations, best_s, mean_s}} per call."""
+    movies = [{'title': f'Movie {index}', 'href': f'https://example.com/{index}',
+               'showing_days': ['2026-01-01', '2026-01-02'],
+               'showtimes': {'2026-01-01': {'2D-Subtitulado': ['19:55', '22:10']}}}
+              for index in range(50)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        scraper.DATA_JSON_PATH = Path(tmp) / 'data.json'
+        scraper.BUNDLE_DIR = Path(tmp) / 'bundle'
+        save = scraper.MovieScraper.__new__(scraper.MovieScraper)
+        save.logger = logging.getLogger('benchmark')
+        save.history = None
+
+        def save_changed():
+            scraper.DATA_JSON_PATH.unlink(missing_ok=True)
+            save.save_data_to_json(movies)
+
+        cases = {
+            'normalize_movie_title': lambda: [scraper.normalize_movie_title(title) for title in MICRO_TITLES],
+            'convert_imdb_duration_to_minutes':
+                lambda: [scraper.convert_imdb_duration_to_minutes(duration) for duration in MICRO_DURATIONS],
+            'save_data_to_json': save_changed,
+            # Same data again: the content hash matches and nothing is written.
+            'save_data_to_json_unchanged': lambda: save.save_data_to_json(movies),
+        }
+        results = {}
+        for name, case in cases.items():
+            iterations = number if not name.startswith('save_data_to_json') else max(1, number // 100)
+            timings = timeit.repeat(case, number=iterations, repeat=repeat)
+            results[name] = {
+                'iterations': iterations,
+                'best_s': min(timings) / iterations,
+                'mean_s': sum(timings) / len(timings) / iterations,
+            }
+    return results
+
+
+def bench_end_to_end(server, args, logger):
+    """Run light and heavy scraping against the stand-in server."""
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        scraper.DATA_JSON_PATH = Path(tmp) / 'data.json'
+        scraper.BUNDLE_DIR = Path(tmp) / 'bundle'
+        scraper.LISTING_FINGERPRINT_PATH = Path(tmp) / 'listing_fingerprint.json'
+        scraper.IMDB_BASE_URL = server.base_url
+        base_url = server.base_url + '/'
+
+        runs = (
+            ('light', lambda s: scraper.run_light_scraping(s, base_url, logger)),
+            ('heavy', lambda s: scraper.run_heavy_scraping(s, base_url, logger, workers=args.workers,
+                                                           imdb_workers=args.imdb_workers)),
+        )
+        for name, run in runs:
+            instance = scraper.MovieScraper(chromedriver_path=args.chromedriver_path, backend=args.backend,
+                                            browser_profile=BrowserProfile(lean=args.lean_browser))
+            requests_before = server.requests
+            start = time.perf_counter()
+            try:
+                # run_heavy_scraping prints every movie; keep the report output clean.
+                with contextlib.redirect_stdout(io.StringIO()):
+                    outcome = run(instance)
+                error = None
+            except Exception as exc:
+                outcome = None
+                error = f'{type(exc).__name__}: {exc}'
+                logger.error(f"{name} run failed: {error}")
+            finally:
+                seconds = time.perf_counter() - start
+                instance.close()
+            results[name] = {
+                'seconds': seconds,
+                'result': outcome,
+                'error': error,
+                'requests': server.requests - requests_before,
+            }
+
+        if scraper.DATA_JSON_PATH.exists():
+            with open(scraper.DATA_JSON_PATH) as f:
+                results['heavy']['movies'] = len(json.load(f))
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark the scraper against a local stand-in server.')
+    add_catalog_arguments(parser)
+    parser.add_argument('--chromedriver-path', type=str, help='Path to the ChromeDriver executable')
+    parser.add_argument('--backend', choices=scraper.BACKENDS, default='http')
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--imdb-workers', type=int, default=0)
+    parser.add_argument('--lean-browser', action='store_true', help='Run Chrome with the lean browser profile.')
+    parser.add_argument('--micro-only', action='store_true', help='Skip the end-to-end runs.')
+    parser.add_argument('--number', type=int, default=10000, help='Calls per micro-benchmark timing.')
+    parser.add_argument('--repeat', type=int, default=5, help='Timings per micro-benchmark.')
+    parser.add_argument('--output', type=str, default='benchmark_results.json')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+                        stream=sys.stderr)
+    logger = logging.getLogger('benchmark')
+
+    report = {
+        'timestamp': time.time(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'config': vars(args),
+        'micro': bench_micro(args.number, args.repeat),
+    }
+
+    if not args.micro_only:
+        server = server_from_args(args).start()
+        try:
+            report['end_to_end'] = bench_end_to_end(server, args, logger)
+            report['server'] = {'requests': server.requests, 'injected_failures': server.failures}
+        finally:
+            server.stop()
+
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=4)
+    print(json.dumps(report, indent=4))
@@ -0,0 +1,108 @@
+"""Per-movie content hashes, showtime probes and showtime diffs.
+
+Every data.json record carries `showtimes_hash` (its showing days and format/
+time grid) and `imdb_hash` (its IMDb fields), so a run can tell which parts of a
+movie changed without comparing whole records. A showtime probe reads only the
+static part of a movie page (see `parse_showtimes_probe` in backends.py) and is
+compared with the stored record; only movies whose probe differs need their
+showtimes refreshed, and `diff_showtimes` describes what changed. Multi-day
+pages only show their first day statically, so a matching probe leaves their
+later days unverified; the report lists those movies separately.
+Each changed movie is reported as:
+
+    {"added_days": [...], "removed_days": [...],
+     "days": {"2025-01-02": {"added_formats": [...], "removed_formats": [...],
+                             "added_times": {format: [...]}, "removed_times": {format: [...]}}}}
+"""
+import hashlib
+import json
+import time
+
+
+IMDB_FIELDS = ('imdb_url', 'imdb_rating', 'metascore', 'imdb_duration')
+HASH_FIELDS = ('showtimes_hash', 'imdb_hash')
+
+
+def _digest(value):
+    return hashlib.sha256(json.dumps(value, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+
+def showtimes_hash(showing_days, showtimes):
+    """Hash of a showtime grid; insensitive to the order of days, formats and times."""
+    return _digest({
+        'showing_days': sorted(showing_days or []),
+        'showtimes': {day: {format_type: sorted(times) for format_type, times in formats.items()}
+                      for day, formats in (showtimes or {}).items()},
+    })
+
+
+def imdb_hash(movie):
+    return _digest({field: movie.get(field) for field in IMDB_FIELDS})
+
+
+def with_content_hashes(movie):
+    """The record with its `showtimes_hash` and `imdb_hash` (re)computed."""
+    movie = {key: value for key, value in movie.items() if key not in HASH_FIELDS}
+    movie['showtimes_hash'] = showtimes_hash(movie.get('showing_days'), movie.get('showtimes'))
+    movie['imdb_hash'] = imdb_hash(movie)
+    return movie
+
+
+def probe_changed(movie, probe):
+    """Whether a showtime probe shows a different schedule than the stored record.
+
+    A complete probe is compared with the stored `showtimes_hash`; a partial
+    one (a multi-day page, where only the first day is in the static HTML) with
+    the stored showing days and the grid of the days it covers.
+    """
+    if probe['complete']:
+        stored = movie.get('showtimes_hash') or showtimes_hash(movie.get('showing_days'), movie.get('showtimes'))
+        return showtimes_hash(probe['showing_days'], probe['showtimes']) != stored
+    stored_showtimes = movie.get('showtimes') or {}
+    covered = {day: stored_showtimes.get(day, {}) for day in probe['showtimes']}
+    return (showtimes_hash(probe['showing_days'], probe['showtimes'])
+            != showtimes_hash(movie.get('showing_days'), covered))
+
+
+def diff_showtimes(old, new):
+    """Added and removed days, formats and times between two records' showtimes."""
+    old_showtimes, new_showtimes = old.get('showtimes') or {}, new.get('showtimes') or {}
+    days = {}
+    for day in sorted(set(old_showtimes) | set(new_showtimes)):
+        old_formats, new_formats = old_showtimes.get(day, {}), new_showtimes.get(day, {})
+        added_times, removed_times = {}, {}
+        for format_type in sorted(set(old_formats) | set(new_formats)):
+            old_times, new_times = set(old_formats.get(format_type, [])), set(new_formats.get(format_type, []))
+            if new_times - old_times:
+                added_times[format_type] = sorted(new_times - old_times)
+            if old_times - new_times:
+                removed_times[format_type] = sorted(old_times - new_times)
+        if added_times or removed_times:
+            days[day] = {
+                'added_formats': sorted(set(new_formats) - set(old_formats)),
+                'removed_formats': sorted(set(old_formats) - set(new_formats)),
+                'added_times': added_times,
+                'removed_times': removed_times,
+            }
+    old_days, new_days = set(old.get('showing_days') or []), set(new.get('showing_days') or [])
+    return {
+        'added_days': sorted(new_days - old_days),
+        'removed_days': sorted(old_days - new_days),
+        'days': days,
+    }
+
+
+def write_diff_report(path, movies, probed, failed, unverified=()):
+    """Write the showtime diff report: run counts, one entry per changed movie and the unverified movies."""
+    report = {
+        'generated_at': time.time(),
+        'probed': probed,
+        'changed': len(movies),
+        'failed': failed,
+        'unverified': len(unverified),
+        'movies': movies,
+        'unverified_movies': list(unverified),
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=4, ensure_ascii=False)
+    return report
@@ -0,0 +1,170 @@
+"""Long-running scraper service: interval scheduler, browser recycling budget and status endpoint.
+
+The daemon only schedules; what a cycle does is the `run_cycle` callable it is
+given (see `make_daemon_cycle` in scraper.py), which returns a dict of metrics
+published on the status endpoint:
+
+    curl http://127.0.0.1:8765/status
+"""
+import json
+import logging
+import os
+import signal
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+DEFAULT_INTERVAL_SECONDS = 30 * 60
+DEFAULT_STATUS_PORT = 8765
+DEFAULT_MAX_SESSION_AGE_SECONDS = 2 * 60 * 60
+DEFAULT_MAX_SESSION_MEMORY_MB = 1500
+
+
+def process_tree_rss_mb(root_pid):
+    """Resident memory of a process and all its descendants in MB, or None where /proc is unavailable."""
+    try:
+        entries = os.listdir('/proc')
+    except OSError:
+        return None
+    children = {}
+    rss = {}
+    page_kb = os.sysconf('SC_PAGE_SIZE') // 1024
+    for entry in entries:
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat') as f:
+                # The command name may contain spaces; fields after it are fixed.
+                fields = f.read().rsplit(')', 1)[1].split()
+        except (OSError, IndexError):
+            continue
+        pid = int(entry)
+        children.setdefault(int(fields[1]), []).append(pid)
+        rss[pid] = int(fields[21]) * page_kb
+    if root_pid not in rss:
+        return None
+    total, stack = 0, [root_pid]
+    while stack:
+        pid = stack.pop()
+        total += rss.get(pid, 0)
+        stack.extend(children.get(pid, []))
+    return total / 1024
+
+
+class StatusServer:
+    """Serve the daemon status as JSON on GET /status (and a plain /healthz)."""
+
+    def __init__(self, status, host='127.0.0.1', port=DEFAULT_STATUS_PORT):
+        self.status = status
+        self.httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path in ('/', '/status'):
+                    status, body, content_type = 200, json.dumps(server.status(), indent=4), 'application/json'
+                elif self.path == '/healthz':
+                    status, body, content_type = 200, 'ok', 'text/plain'
+                else:
+                    status, body, content_type = 404, 'not found', 'text/plain'
+                payload = body.encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', f'{content_type}; charset=utf-8')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+class ScraperDaemon:
+    """Run `run_cycle()` every `interval_seconds` until stopped, tracking the last runs.
+
+    A failing cycle is logged and counted; the daemon keeps going. SIGTERM and
+    SIGINT stop it after the current cycle.
+    """
+
+    def __init__(self, run_cycle, interval_seconds=DEFAULT_INTERVAL_SECONDS, status_port=DEFAULT_STATUS_PORT,
+                 status_host='127.0.0.1'):
+        self.logger = logging.getLogger(__name__)
+        self.run_cycle = run_cycle
+        self.interval_seconds = interval_seconds
+        self.status_port = status_port
+        self.status_host = status_host
+        self.started_at = None
+        self.cycles = 0
+        self.failed_cycles = 0
+        self.last_run = None
+        self.next_run_at = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def status(self):
+        with self._lock:
+            return {
+                'pid': os.getpid(),
+                'started_at': self.started_at,
+                'uptime_s': time.time() - self.started_at if self.started_at else 0,
+                'interval_s': self.interval_seconds,
+                'cycles': self.cycles,
+                'failed_cycles': self.failed_cycles,
+                'next_run_at': self.next_run_at,
+                'last_run': self.last_run,
+            }
+
+    def stop(self, *_):
+        self.logger.info("Stopping daemon after the current cycle...")
+        self._stop.set()
+
+    def _run_once(self):
+        started_at = time.time()
+        start = time.perf_counter()
+        try:
+            metrics, error = self.run_cycle(), None
+        except Exception as exc:
+            self.logger.exception("Daemon cycle failed")
+            metrics, error = {}, f'{type(exc).__name__}: {exc}'
+        with self._lock:
+            self.cycles += 1
+            self.failed_cycles += error is not None
+            self.last_run = {
+                'started_at': started_at,
+                'duration_s': time.perf_counter() - start,
+                'error': error,
+                **metrics,
+            }
+
+    def serve_forever(self):
+        self.started_at = time.time()
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, self.stop)
+            signal.signal(signal.SIGINT, self.stop)
+        server = StatusServer(self.status, self.status_host, self.status_port).start() if self.status_port else None
+        if server is not None:
+            self.logger.info(f"Status endpoint on http://{self.status_host}:{self.status_port}/status")
+        try:
+            while not self._stop.is_set():
+                self._run_once()
+                with self._lock:
+                    self.next_run_at = time.time() + self.interval_seconds
+                self._stop.wait(self.interval_seconds)
+        finally:
+            if server is not None:
+                server.stop()
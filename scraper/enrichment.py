@@ -0,0 +1,75 @@
+"""Asynchronous IMDb enrichment stage, decoupled from Showcase scraping."""
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+IMDB_FIELDS = ('imdb_url', 'imdb_rating', 'metascore', 'imdb_duration')
+
+
+class RateLimiter:
+    """Space out calls so that at most `rate` of them start per second."""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate else 0.0
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self):
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next_start - now
+            self._next_start = max(now, self._next_start) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class ImdbEnricher:
+    """Consume scraped Showcase records from a queue and fill in their IMDb fields.
+
+    `enrich(record, director)` is a blocking callable returning the IMDb fields;
+    it runs on a thread pool of `concurrency` threads, started at most `rate`
+    times per second. When it fails, `fallback(record)` provides the fields so
+    the record can still be saved without IMDb data. `on_done(record)` is
+    called once a record has its IMDb fields.
+    """
+
+    def __init__(self, enrich, fallback, concurrency=2, rate=1.0, on_done=None):
+        self.logger = logging.getLogger(__name__)
+        self.enrich = enrich
+        self.fallback = fallback
+        self.on_done = on_done
+        self.concurrency = concurrency
+        self.limiter = RateLimiter(rate)
+        self.enriched = 0
+        self.failed = 0
+
+    async def run(self, records):
+        """Enrich (record, director) items from `records` until a None sentinel arrives."""
+        semaphore = asyncio.Semaphore(self.concurrency)
+        tasks = []
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            while True:
+                item = await records.get()
+                if item is None:
+                    break
+                tasks.append(asyncio.create_task(self._enrich_one(executor, semaphore, *item)))
+            await asyncio.gather(*tasks)
+        self.logger.info("IMDb enrichment finished: %d enriched, %d without IMDb data.",
+                         self.enriched, self.failed)
+
+    async def _enrich_one(self, executor, semaphore, record, director):
+        loop = asyncio.get_running_loop()
+        async with semaphore:
+            await self.limiter.wait()
+            try:
+                fields = await loop.run_in_executor(executor, self.enrich, record, director)
+                self.enriched += 1
+            except Exception as exc:
+                self.logger.warning("IMDb enrichment failed for %s: %s", record.get('href'), exc)
+                fields = self.fallback(record)
+                self.failed += 1
+        record.update({field: fields[field] for field in IMDB_FIELDS})
+        if self.on_done is not None:
+            self.on_done(record)
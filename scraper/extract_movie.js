@@ -0,0 +1,101 @@
+// Extract a whole Showcase movie page in one WebDriver round trip.
+// Run with execute_async_script: the last argument is the completion callback.
+// Clicks through every day in the page itself and returns the same shape as
+// the Python extraction, or {error: "..."} when the page is incomplete.
+const done = arguments[arguments.length - 1];
+
+const LOAD_TIMEOUT_MS = 15000;
+const DAY_TIMEOUT_MS = 10000;
+const SETTLE_MS = 300;
+const POLL_MS = 50;
+
+const text = element => (element ? element.innerText.trim() : '');
+
+function waitFor(condition, timeoutMs) {
+    return new Promise((resolve, reject) => {
+        const start = Date.now();
+        (function poll() {
+            const elapsed = Date.now() - start;
+            if (condition(elapsed)) {
+                resolve();
+            } else if (elapsed > timeoutMs) {
+                reject(new Error('timed out waiting for showtimes'));
+            } else {
+                setTimeout(poll, POLL_MS);
+            }
+        })();
+    });
+}
+
+function ajaxIdle() {
+    return !window.jQuery || window.jQuery.active === 0;
+}
+
+function followingDiv(element) {
+    let sibling = element.nextElementSibling;
+    while (sibling && sibling.tagName !== 'DIV') {
+        sibling = sibling.nextElementSibling;
+    }
+    return sibling;
+}
+
+function readGrid() {
+    const grid = {};
+    document.querySelectorAll('.op_format').forEach(formatElement => {
+        const timeContainer = followingDiv(formatElement);
+        if (!timeContainer) {
+            return;
+        }
+        grid[formatElement.innerHTML.trim()] = Array.from(
+            timeContainer.querySelectorAll('button.op_perf'),
+            button => button.innerHTML.trim()
+        );
+    });
+    return grid;
+}
+
+async function extract() {
+    await waitFor(() => document.querySelector('.op_format'), LOAD_TIMEOUT_MS);
+
+    const title = document.querySelector('.movie-info-box .name > strong');
+    const poster = document.querySelector('.movie-side-info-box figure > img');
+    const originalTitle = document.querySelector('.movie-side-info-box ul > li:first-of-type');
+    const duration = document.querySelector('.movie-info-box ul.features .year');
+    if (!title || !poster || !originalTitle || !duration) {
+        return { error: 'movie page is missing required fields' };
+    }
+
+    let director = '';
+    for (const li of document.querySelectorAll('.movie-side-info-box ul > li')) {
+        if (li.innerText.includes('Director:')) {
+            director = li.innerText.replace('Director:', '').trim();
+            break;
+        }
+    }
+
+    const container = document.querySelector('.movie-info-box #op_container');
+    const showtimes = {};
+    for (const day of document.querySelectorAll('.movie-info-box #op_container .op_days .op_day')) {
+        const before = container ? container.innerHTML : '';
+        day.click();
+        // Wait for the day's AJAX response; identical grids settle after SETTLE_MS.
+        await waitFor(elapsed => document.querySelector('.op_format') && ajaxIdle()
+            && (elapsed > SETTLE_MS || (container && container.innerHTML !== before)), DAY_TIMEOUT_MS);
+        showtimes[day.getAttribute('value')] = readGrid();
+    }
+
+    return {
+        title: text(title),
+        original_title: text(originalTitle).replace('Título Original: ', ''),
+        poster_url: poster.src,
+        duration: text(duration),
+        director: director,
+        showing_days: Array.from(
+            document.querySelectorAll('.movie-info-box .op_days > button'),
+            button => button.getAttribute('value')
+        ),
+        showtimes: showtimes,
+    };
+}
+
+extract().then(done, error => done({ error: String(error) }));
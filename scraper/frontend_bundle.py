@@ -0,0 +1,91 @@
+"""Build the precomputed, per-day sharded data bundle served to the frontend."""
+import gzip
+import hashlib
+import json
+from datetime import date, timedelta
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:  # Optional: only the .gz siblings are written without it.
+    brotli = None
+
+
+# Mirrors SPECIAL_SHOWS_MAX_DAYS and identifySpecialShows in docs/script.js.
+SPECIAL_SHOWS_MAX_DAYS = 7
+SPECIAL_SHOWS_ALWAYS_DAYS = 4
+
+# Fields the day view renders; everything else stays in data.json only.
+DAY_FIELDS = ('title', 'href', 'poster_url', 'duration', 'imdb_url', 'imdb_rating', 'metascore')
+
+
+def _dumps(data):
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def _write(path, payload):
+    """Write a file and its precompressed .gz (and .br, when available) siblings."""
+    path.write_bytes(payload)
+    path.with_name(path.name + '.gz').write_bytes(gzip.compress(payload, compresslevel=9, mtime=0))
+    if brotli is not None:
+        path.with_name(path.name + '.br').write_bytes(brotli.compress(payload, quality=11))
+
+
+def is_special_show(movie):
+    """Whether a movie has a limited or non-consecutive run.
+
+    The frontend still checks that the first day is tomorrow or later, since
+    that depends on the day the page is viewed rather than the day of the build.
+    """
+    showing_days = sorted(movie.get('showing_days') or [])
+    if not showing_days or len(showing_days) >= SPECIAL_SHOWS_MAX_DAYS:
+        return False
+    if len(showing_days) <= SPECIAL_SHOWS_ALWAYS_DAYS:
+        return True
+    days = [date.fromisoformat(day) for day in showing_days]
+    return any(later - earlier != timedelta(days=1) for earlier, later in zip(days, days[1:]))
+
+
+def build_days(movies):
+    """Group movies by showing day, keeping only that day's showtimes, sorted by date."""
+    days = {}
+    for movie in movies:
+        for day in movie.get('showing_days', []):
+            record = {field: movie.get(field) for field in DAY_FIELDS}
+            record['showtimes'] = {day: movie.get('showtimes', {}).get(day, {})}
+            days.setdefault(day, []).append(record)
+    return dict(sorted(days.items()))
+
+
+def build_bundle(movies, out_dir):
+    """Write manifest.json, days/<date>.json and special_shows.json (plus .gz/.br) into out_dir."""
+    out_dir = Path(out_dir)
+    days_dir = out_dir / 'days'
+    days_dir.mkdir(parents=True, exist_ok=True)
+    for stale in days_dir.iterdir():
+        stale.unlink()
+
+    digest = hashlib.sha256()
+    day_files = {}
+    for day, day_movies in build_days(movies).items():
+        payload = _dumps(day_movies)
+        digest.update(payload)
+        _write(days_dir / f'{day}.json', payload)
+        day_files[day] = {'file': f'days/{day}.json', 'movies': len(day_movies)}
+
+    special_shows = [{**{field: movie.get(field) for field in DAY_FIELDS},
+                      'showing_days': movie.get('showing_days', []),
+                      'showtimes': movie.get('showtimes', {})}
+                     for movie in movies if is_special_show(movie)]
+    special_payload = _dumps(special_shows)
+    digest.update(special_payload)
+    _write(out_dir / 'special_shows.json', special_payload)
+
+    manifest = {
+        'version': digest.hexdigest()[:12],
+        'dates': list(day_files),
+        'days': day_files,
+        'special_shows': 'special_shows.json',
+    }
+    _write(out_dir / 'manifest.json', _dumps(manifest))
+    return manifest
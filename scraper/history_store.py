@@ -0,0 +1,286 @@
+"""SQLite scrape history: current movies and showtimes plus a per-run change log.
+
+Each run is a row in `runs`. `movies` and `showtimes` hold the current state and
+are only written where a run changed something: a movie record that differs
+from the stored one gets a new row in `movie_versions`, and every showtime
+`(movie, date, format, time)` that appears or disappears gets a row in
+`showtime_events`. `data.json` is exported from these tables; each movie keeps
+its showtime grid as scraped (`showtimes_grid`), so Showcase's format order and
+days without showtimes survive the round trip.
+
+    python scraper/history_store.py changes --days 7
+    python scraper/history_store.py first-seen "Avatar"
+"""
+import argparse
+import hashlib
+import json
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+from change_detection import HASH_FIELDS
+
+
+HISTORY_DB_PATH = Path(__file__).resolve().parent / ".." / "docs" / "history.sqlite"
+
+# Diagnostics that change between runs without the movie changing; stored, but not versioned.
+UNVERSIONED_FIELDS = ('selenium_fallback',)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    started_at REAL NOT NULL,
+    movies INTEGER NOT NULL DEFAULT 0,
+    changed_movies INTEGER NOT NULL DEFAULT 0,
+    added_showtimes INTEGER NOT NULL DEFAULT 0,
+    removed_showtimes INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS movies (
+    href TEXT PRIMARY KEY,
+    title TEXT,
+    original_title TEXT,
+    imdb_url TEXT,
+    imdb_rating TEXT,
+    metascore TEXT,
+    imdb_duration TEXT,
+    position INTEGER,
+    showing_days TEXT NOT NULL,
+    showtimes_grid TEXT,
+    record TEXT NOT NULL,
+    record_hash TEXT NOT NULL,
+    first_seen_run INTEGER NOT NULL REFERENCES runs (id),
+    updated_run INTEGER NOT NULL REFERENCES runs (id),
+    removed_run INTEGER REFERENCES runs (id)
+);
+CREATE INDEX IF NOT EXISTS movies_listing ON movies (removed_run, position);
+CREATE TABLE IF NOT EXISTS movie_versions (
+    href TEXT NOT NULL,
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    record TEXT NOT NULL,
+    PRIMARY KEY (href, run_id)
+);
+CREATE TABLE IF NOT EXISTS showtimes (
+    href TEXT NOT NULL,
+    date TEXT NOT NULL,
+    format TEXT NOT NULL,
+    time TEXT NOT NULL,
+    first_seen_run INTEGER NOT NULL REFERENCES runs (id),
+    PRIMARY KEY (href, date, format, time)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS showtime_events (
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    href TEXT NOT NULL,
+    date TEXT NOT NULL,
+    format TEXT NOT NULL,
+    time TEXT NOT NULL,
+    change TEXT NOT NULL CHECK (change IN ('added', 'removed'))
+);
+CREATE INDEX IF NOT EXISTS showtime_events_run ON showtime_events (run_id, href);
+"""
+
+
+def showtime_rows(movie):
+    """The (date, format, time) rows of a movie's showtimes."""
+    return {(day, format_type, time_)
+            for day, formats in movie.get('showtimes', {}).items()
+            for format_type, times in formats.items()
+            for time_ in times}
+
+
+def _record(movie):
+    """The versioned part of a movie: everything except href, showing days, showtimes and content hashes."""
+    return {key: value for key, value in movie.items()
+            if key not in ('href', 'showing_days', 'showtimes', *HASH_FIELDS)}
+
+
+def _record_hash(record):
+    versioned = {key: value for key, value in record.items() if key not in UNVERSIONED_FIELDS}
+    return hashlib.sha256(json.dumps(versioned, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+class HistoryStore:
+    """Record runs into the history database and export the current listing from it."""
+
+    def __init__(self, path=HISTORY_DB_PATH):
+        self.path = Path(path)
+        self.conn = sqlite3.connect(self.path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(SCHEMA)
+        columns = {row['name'] for row in self.conn.execute("PRAGMA table_info(movies)")}
+        if 'showtimes_grid' not in columns:
+            # Databases created before the grid was stored; their rows export from `showtimes` until rescraped.
+            self.conn.execute("ALTER TABLE movies ADD COLUMN showtimes_grid TEXT")
+
+    def close(self):
+        self.conn.close()
+
+    def record_run(self, movies, started_at=None):
+        """Store a run's full listing, writing only what changed.
+
+        Returns the run id, or None when nothing changed (the run is not kept).
+        """
+        with self.conn:
+            run_id = self.conn.execute("INSERT INTO runs (started_at, movies) VALUES (?, ?)",
+                                       (started_at or time.time(), len(movies))).lastrowid
+            stored = {row['href']: row for row in self.conn.execute(
+                "SELECT href, position, showing_days, showtimes_grid, record_hash, removed_run FROM movies")}
+            changed_movies = added = removed = moved = 0
+
+            for position, movie in enumerate(movies):
+                href = movie['href']
+                record = _record(movie)
+                record_hash = _record_hash(record)
+                showing_days = json.dumps(movie.get('showing_days', []))
+                showtimes_grid = json.dumps(movie.get('showtimes', {}), ensure_ascii=False)
+                row = stored.get(href)
+                if row is None:
+                    self.conn.execute(
+                        "INSERT INTO movies (href, title, original_title, imdb_url, imdb_rating, metascore, "
+                        "imdb_duration, position, showing_days, showtimes_grid, record, record_hash, first_seen_run, "
+                        "updated_run) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (href, movie.get('title'), movie.get('original_title'), movie.get('imdb_url'),
+                         movie.get('imdb_rating'), movie.get('metascore'), movie.get('imdb_duration'), position,
+                         showing_days, showtimes_grid, json.dumps(record), record_hash, run_id, run_id))
+                elif row['record_hash'] != record_hash:
+                    self.conn.execute(
+                        "UPDATE movies SET title = ?, original_title = ?, imdb_url = ?, imdb_rating = ?, "
+                        "metascore = ?, imdb_duration = ?, record = ?, record_hash = ?, updated_run = ? "
+                        "WHERE href = ?",
+                        (movie.get('title'), movie.get('original_title'), movie.get('imdb_url'),
+                         movie.get('imdb_rating'), movie.get('metascore'), movie.get('imdb_duration'),
+                         json.dumps(record), record_hash, run_id, href))
+                if row is None or row['record_hash'] != record_hash:
+                    self.conn.execute("INSERT INTO movie_versions (href, run_id, record) VALUES (?, ?, ?)",
+                                      (href, run_id, json.dumps(record)))
+                    changed_movies += 1
+                if row is not None and (row['position'] != position or row['showing_days'] != showing_days
+                                        or row['showtimes_grid'] != showtimes_grid or row['removed_run'] is not None):
+                    self.conn.execute("UPDATE movies SET position = ?, showing_days = ?, showtimes_grid = ?, "
+                                      "removed_run = NULL WHERE href = ?", (position, showing_days, showtimes_grid, href))
+                    moved += 1
+
+                new_rows, old_rows = self._diff_showtimes(href, showtime_rows(movie))
+                added += len(new_rows)
+                removed += len(old_rows)
+                self._apply_showtimes(run_id, href, new_rows, old_rows)
+
+            current = {movie['href'] for movie in movies}
+            for href, row in stored.items():
+                if href not in current and row['removed_run'] is None:
+                    self.conn.execute("UPDATE movies SET removed_run = ?, position = NULL WHERE href = ?",
+                                      (run_id, href))
+                    moved += 1
+                    _, old_rows = self._diff_showtimes(href, set())
+                    removed += len(old_rows)
+                    self._apply_showtimes(run_id, href, set(), old_rows)
+
+            if not (changed_movies or added or removed or moved):
+                # Roll back rather than delete the run, so the database file is left byte for byte as it was.
+                self.conn.rollback()
+                return None
+            self.conn.execute("UPDATE runs SET changed_movies = ?, added_showtimes = ?, removed_showtimes = ? "
+                              "WHERE id = ?", (changed_movies, added, removed, run_id))
+        return run_id
+
+    def _diff_showtimes(self, href, rows):
+        stored = {(row['date'], row['format'], row['time']) for row in self.conn.execute(
+            "SELECT date, format, time FROM showtimes WHERE href = ?", (href,))}
+        return rows - stored, stored - rows
+
+    def _apply_showtimes(self, run_id, href, new_rows, old_rows):
+        self.conn.executemany("INSERT INTO showtimes (href, date, format, time, first_seen_run) VALUES (?, ?, ?, ?, ?)",
+                              [(href, *row, run_id) for row in new_rows])
+        self.conn.executemany("DELETE FROM showtimes WHERE href = ? AND date = ? AND format = ? AND time = ?",
+                              [(href, *row) for row in old_rows])
+        self.conn.executemany("INSERT INTO showtime_events (run_id, href, date, format, time, change) "
+                              "VALUES (?, ?, ?, ?, ?, ?)",
+                              [(run_id, href, *row, 'added') for row in new_rows] +
+                              [(run_id, href, *row, 'removed') for row in old_rows])
+
+    def is_empty(self):
+        return self.conn.execute("SELECT 1 FROM runs LIMIT 1").fetchone() is None
+
+    def current_hrefs(self):
+        """Hrefs of the movies in the latest listing (the light check's comparison set)."""
+        return sorted(row[0] for row in self.conn.execute("SELECT href FROM movies WHERE removed_run IS NULL"))
+
+    def export_movies(self):
+        """The current listing as data.json records, in listing order.
+
+        Showtimes come out as they were recorded. Rows stored before the grid
+        was kept are rebuilt from `showtimes`, with dates and times sorted and
+        formats alphabetically within a day.
+        """
+        showtimes = {}
+        for row in self.conn.execute("SELECT s.href, s.date, s.format, s.time FROM showtimes s "
+                                     "JOIN movies m ON m.href = s.href WHERE m.removed_run IS NULL "
+                                     "ORDER BY s.href, s.date, s.format, s.time"):
+            showtimes.setdefault(row['href'], {}).setdefault(row['date'], {}).setdefault(row['format'], []).append(
+                row['time'])
+
+        movies = []
+        for row in self.conn.execute("SELECT href, showing_days, showtimes_grid, record FROM movies "
+                                     "WHERE removed_run IS NULL ORDER BY position"):
+            record = json.loads(row['record'])
+            movie = {key: record.pop(key) for key in ('title',) if key in record}
+            movie['href'] = row['href']
+            movie.update({key: record.pop(key) for key in ('original_title', 'poster_url', 'duration')
+                          if key in record})
+            movie['showing_days'] = json.loads(row['showing_days'])
+            movie['showtimes'] = (json.loads(row['showtimes_grid']) if row['showtimes_grid'] is not None
+                                  else showtimes.get(row['href'], {}))
+            movie.update(record)
+            movies.append(movie)
+        return movies
+
+    def showtime_changes(self, since):
+        """Movies whose showtimes changed since a timestamp: {href: {title, added, removed}}."""
+        changes = {}
+        for row in self.conn.execute(
+                "SELECT e.href, m.title, e.change, COUNT(*) AS count FROM showtime_events e "
+                "JOIN runs r ON r.id = e.run_id LEFT JOIN movies m ON m.href = e.href "
+                "WHERE r.started_at >= ? GROUP BY e.href, e.change", (since,)):
+            change = changes.setdefault(row['href'], {'title': row['title'], 'added': 0, 'removed': 0})
+            change[row['change']] = row['count']
+        return changes
+
+    def first_seen(self, title_or_href):
+        """When matching movies first appeared: [{href, title, first_seen_at, removed_at}]."""
+        pattern = f'%{title_or_href}%'
+        return [dict(row) for row in self.conn.execute(
+            "SELECT m.href, m.title, first.started_at AS first_seen_at, removed.started_at AS removed_at "
+            "FROM movies m JOIN runs first ON first.id = m.first_seen_run "
+            "LEFT JOIN runs removed ON removed.id = m.removed_run "
+            "WHERE m.href = ? OR m.title LIKE ? OR m.original_title LIKE ? ORDER BY first.started_at",
+            (title_or_href, pattern, pattern))]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Query the scrape history database.')
+    parser.add_argument('--db', default=str(HISTORY_DB_PATH), help='History database path.')
+    commands = parser.add_subparsers(dest='command', required=True)
+    changes = commands.add_parser('changes', help='Movies whose showtimes changed recently.')
+    changes.add_argument('--days', type=float, default=7)
+    first_seen = commands.add_parser('first-seen', help='When a movie (title or href) first appeared.')
+    first_seen.add_argument('movie')
+    seed = commands.add_parser('import', help='Record a data.json file as a run.')
+    seed.add_argument('path')
+    export = commands.add_parser('export', help='Print the current listing as data.json.')
+    args = parser.parse_args()
+
+    store = HistoryStore(args.db)
+    try:
+        if args.command == 'changes':
+            result = store.showtime_changes(time.time() - args.days * 24 * 60 * 60)
+        elif args.command == 'first-seen':
+            result = store.first_seen(args.movie)
+        elif args.command == 'import':
+            with open(args.path) as f:
+                result = {'run_id': store.record_run(json.load(f))}
+        else:
+            result = store.export_movies()
+        json.dump(result, sys.stdout, indent=4, ensure_ascii=False)
+        print()
+    finally:
+        store.close()
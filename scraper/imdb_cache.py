@@ -0,0 +1,99 @@
+"""Persistent cache of IMDb title resolutions."""
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+
+
+CACHE_VERSION = 1
+POSITIVE_TTL_SECONDS = 30 * 24 * 3600
+NEGATIVE_TTL_SECONDS = 3 * 24 * 3600
+MAX_ENTRIES = 2000
+
+# use: read and write the cache; bypass: ignore it entirely;
+# rebuild: ignore stored entries and replace them with this run's results.
+CACHE_MODES = ('use', 'bypass', 'rebuild')
+
+
+class ImdbCache:
+    """Map a normalized (original title, director) key to its resolved IMDb URL.
+
+    Entries expire after `ttl` seconds, or `negative_ttl` seconds when no title
+    was found. When there are more than `max_entries`, the least recently used
+    entries are dropped on save. Hits only update recency in memory: the file
+    is rewritten when entries are added or replaced, not on a run that only
+    read from it. Safe to share between scraper threads.
+    """
+
+    def __init__(self, path, mode='use', ttl=POSITIVE_TTL_SECONDS,
+                 negative_ttl=NEGATIVE_TTL_SECONDS, max_entries=MAX_ENTRIES):
+        self.logger = logging.getLogger(__name__)
+        self.path = Path(path)
+        self.mode = mode
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._entries = self._load() if mode == 'use' else {}
+
+    def _load(self):
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as exc:
+            self.logger.warning("Ignoring unreadable IMDb cache %s: %s", self.path, exc)
+            return {}
+        if data.get('version') != CACHE_VERSION:
+            return {}
+        return data.get('entries', {})
+
+    def get(self, key):
+        """Return (hit, url). Expired entries count as misses."""
+        if self.mode == 'bypass':
+            return False, None
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            ttl = self.ttl if entry and entry['found'] else self.negative_ttl
+            if entry is None or now - entry['resolved_at'] > ttl:
+                self.misses += 1
+                return False, None
+            entry['last_used'] = now
+            self.hits += 1
+            return True, entry['url']
+
+    def put(self, key, url, found):
+        if self.mode == 'bypass':
+            return
+        now = time.time()
+        with self._lock:
+            self._entries[key] = {'url': url, 'found': found, 'resolved_at': now, 'last_used': now}
+            self._dirty = True
+
+    def save(self):
+        """Write the cache to disk, evicting least recently used entries over the cap."""
+        if self.mode == 'bypass':
+            return
+        with self._lock:
+            if not self._dirty and self.mode != 'rebuild':
+                return
+            entries = self._entries
+            if len(entries) > self.max_entries:
+                newest = sorted(entries.items(), key=lambda item: item[1]['last_used'], reverse=True)
+                entries = dict(newest[:self.max_entries])
+                self._entries = entries
+            payload = {'version': CACHE_VERSION, 'entries': entries}
+            tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump(payload, f, indent=1, sort_keys=True, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        self.logger.info("IMDb cache saved: %d entries (%d hits, %d misses this run).",
+                         len(entries), self.hits, self.misses)
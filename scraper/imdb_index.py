@@ -0,0 +1,273 @@
+"""Offline IMDb title index built from the public TSV dumps.
+
+Resolves an original title and director to an IMDb title without loading the
+find page or verifying candidates in the browser. The index is a SQLite file
+with indexed title keys and title tokens; lookups are a couple of indexed
+queries plus trigram scoring of a few dozen candidates.
+
+Build it from title.basics, title.crew, name.basics and title.ratings
+(https://datasets.imdbws.com/, .tsv or .tsv.gz):
+
+    python scraper/imdb_index.py --dumps ~/imdb-dumps --output scraper/imdb_index.sqlite
+"""
+import argparse
+import csv
+import gzip
+import logging
+import math
+import re
+import sqlite3
+import sys
+import threading
+import time
+from datetime import date
+from pathlib import Path
+
+from text_normalization import strip_accents
+
+
+INDEX_PATH = Path(__file__).resolve().parent / "imdb_index.sqlite"
+
+TITLE_TYPES = ('movie', 'tvMovie', 'video', 'short')
+# Tokens too common to narrow the fuzzy lookup.
+STOPWORDS = frozenset('the and of el la los las de del y le les des un une a an en il lo der die das'.split())
+FUZZY_CANDIDATES = 200
+MIN_TITLE_SIMILARITY = 0.9
+
+NON_ALNUM = re.compile(r'[^0-9a-z]+')
+
+SCHEMA = """
+CREATE TABLE titles (
+    tconst TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    original_title TEXT NOT NULL,
+    title_type TEXT NOT NULL,
+    year INTEGER,
+    runtime INTEGER,
+    rating REAL,
+    votes INTEGER,
+    directors TEXT NOT NULL DEFAULT ''
+) WITHOUT ROWID;
+CREATE TABLE title_keys (key TEXT NOT NULL, tconst TEXT NOT NULL);
+CREATE TABLE title_tokens (token TEXT NOT NULL, tconst TEXT NOT NULL);
+"""
+INDEXES = """
+CREATE INDEX title_keys_key ON title_keys (key);
+CREATE INDEX title_tokens_token ON title_tokens (token);
+"""
+
+
+def normalize_key(text):
+    """Accent-free, case-folded title or name with punctuation collapsed to single spaces."""
+    return NON_ALNUM.sub(' ', strip_accents(text or '').casefold()).strip()
+
+
+def title_tokens(key):
+    return {token for token in key.split() if len(token) > 1 and token not in STOPWORDS}
+
+
+def trigrams(key):
+    padded = f'  {key} '
+    return {padded[index:index + 3] for index in range(len(padded) - 2)}
+
+
+def similarity(left, right):
+    """Trigram Jaccard similarity of two normalized keys (1.0 when equal)."""
+    if left == right:
+        return 1.0
+    a, b = trigrams(left), trigrams(right)
+    return len(a & b) / len(a | b) if a and b else 0.0
+
+
+def director_score(director, names):
+    """1.0 for a full-name match, 0.6 for a surname-only match, 0.0 otherwise."""
+    director_key = normalize_key(director)
+    if not director_key:
+        return 0.0
+    keys = [normalize_key(name) for name in names]
+    if director_key in keys:
+        return 1.0
+    surname = director_key.split()[-1]
+    return 0.6 if any(key.split() and key.split()[-1] == surname for key in keys) else 0.0
+
+
+def _read_tsv(path):
+    opener = gzip.open if path.suffix == '.gz' else open
+    with opener(path, 'rt', encoding='utf-8', newline='') as f:
+        for row in csv.DictReader(f, delimiter='\t', quoting=csv.QUOTE_NONE):
+            yield {key: (None if value == '\\N' else value) for key, value in row.items()}
+
+
+def _dump_path(dumps_dir, name):
+    for candidate in (dumps_dir / f'{name}.tsv.gz', dumps_dir / f'{name}.tsv'):
+        if candidate.exists():
+            return candidate
+    raise FileNotFoundError(f"{name}.tsv(.gz) not found in {dumps_dir}")
+
+
+def _to_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def build_index(dumps_dir, output_path=INDEX_PATH, title_types=TITLE_TYPES):
+    """Build the SQLite index from the TSV dumps; returns the number of titles indexed."""
+    logger = logging.getLogger(__name__)
+    dumps_dir = Path(dumps_dir)
+    output_path = Path(output_path)
+    tmp_path = output_path.with_suffix(output_path.suffix + '.tmp')
+    tmp_path.unlink(missing_ok=True)
+
+    conn = sqlite3.connect(tmp_path)
+    conn.executescript(SCHEMA)
+    titles = set()
+    with conn:
+        rows = ((row['tconst'], row['primaryTitle'], row['originalTitle'], row['titleType'],
+                 _to_int(row['startYear']), _to_int(row['runtimeMinutes']))
+                for row in _read_tsv(_dump_path(dumps_dir, 'title.basics'))
+                if row['titleType'] in title_types and row['isAdult'] != '1')
+        for tconst, title, original_title, title_type, year, runtime in rows:
+            titles.add(tconst)
+            conn.execute("INSERT INTO titles (tconst, title, original_title, title_type, year, runtime) "
+                         "VALUES (?, ?, ?, ?, ?, ?)", (tconst, title, original_title, title_type, year, runtime))
+            keys = {normalize_key(title), normalize_key(original_title)} - {''}
+            conn.executemany("INSERT INTO title_keys VALUES (?, ?)", [(key, tconst) for key in keys])
+            tokens = set().union(*(title_tokens(key) for key in keys)) if keys else set()
+            conn.executemany("INSERT INTO title_tokens VALUES (?, ?)", [(token, tconst) for token in tokens])
+    logger.info("Indexed %d titles", len(titles))
+
+    crew = {}
+    for row in _read_tsv(_dump_path(dumps_dir, 'title.crew')):
+        if row['tconst'] in titles and row['directors']:
+            crew[row['tconst']] = row['directors'].split(',')
+    wanted = set().union(*crew.values()) if crew else set()
+    names = {row['nconst']: row['primaryName']
+             for row in _read_tsv(_dump_path(dumps_dir, 'name.basics'))
+             if row['nconst'] in wanted and row['primaryName']}
+    with conn:
+        conn.executemany("UPDATE titles SET directors = ? WHERE tconst = ?",
+                         (('|'.join(names[nconst] for nconst in nconsts if nconst in names), tconst)
+                          for tconst, nconsts in crew.items()))
+        conn.executemany("UPDATE titles SET rating = ?, votes = ? WHERE tconst = ?",
+                         ((float(row['averageRating']), _to_int(row['numVotes']), row['tconst'])
+                          for row in _read_tsv(_dump_path(dumps_dir, 'title.ratings'))
+                          if row['tconst'] in titles))
+        conn.executescript(INDEXES)
+    conn.execute("ANALYZE")
+    conn.execute("VACUUM")
+    conn.close()
+    tmp_path.replace(output_path)
+    return len(titles)
+
+
+class ImdbIndex:
+    """Read-only lookups against a built index; safe to share between scraper threads."""
+
+    def __init__(self, path=INDEX_PATH):
+        self.path = Path(path)
+        if not self.path.exists():
+            raise FileNotFoundError(f"IMDb index not found: {self.path}")
+        self._local = threading.local()
+
+    def _connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(f'file:{self.path}?mode=ro', uri=True)
+            conn.row_factory = sqlite3.Row
+            self._local.conn = conn
+        return conn
+
+    def _titles(self, tconsts):
+        if not tconsts:
+            return []
+        placeholders = ','.join('?' * len(tconsts))
+        return self._connection().execute(f"SELECT * FROM titles WHERE tconst IN ({placeholders})",
+                                          list(tconsts)).fetchall()
+
+    def _exact(self, key):
+        return {row[0] for row in self._connection().execute("SELECT tconst FROM title_keys WHERE key = ?", (key,))}
+
+    def _fuzzy(self, key):
+        tokens = sorted(title_tokens(key))
+        if not tokens:
+            return set()
+        placeholders = ','.join('?' * len(tokens))
+        rows = self._connection().execute(
+            f"SELECT tconst FROM title_tokens WHERE token IN ({placeholders}) "
+            f"GROUP BY tconst ORDER BY COUNT(*) DESC LIMIT ?", (*tokens, FUZZY_CANDIDATES))
+        return {row[0] for row in rows}
+
+    def lookup(self, original_title, director='', runtime=None, limit=5):
+        """Ranked candidates for a title: exact key matches first, fuzzy token matches otherwise.
+
+        Each candidate is a dict with the title's fields plus `title_similarity`,
+        `director_score` and the overall `score`.
+        """
+        key = normalize_key(original_title)
+        if not key:
+            return []
+        tconsts = self._exact(key) or self._fuzzy(key)
+        current_year = date.today().year
+        candidates = []
+        for row in self._titles(tconsts):
+            candidate = dict(row)
+            candidate['directors'] = [name for name in row['directors'].split('|') if name]
+            candidate['title_similarity'] = max(similarity(key, normalize_key(row['title'])),
+                                                similarity(key, normalize_key(row['original_title'])))
+            candidate['director_score'] = director_score(director, candidate['directors'])
+            candidate['score'] = self._score(candidate, director, runtime, current_year)
+            candidates.append(candidate)
+        candidates.sort(key=lambda candidate: candidate['score'], reverse=True)
+        return candidates[:limit]
+
+    @staticmethod
+    def _score(candidate, director, runtime, current_year):
+        score = 0.6 * candidate['title_similarity']
+        if director:
+            score += 0.25 * candidate['director_score']
+        if runtime and candidate['runtime']:
+            score += 0.1 * max(0.0, 1 - abs(runtime - candidate['runtime']) / 20)
+        if candidate['year']:
+            # Cinema listings are mostly recent releases.
+            score += 0.05 * max(0.0, 1 - max(0, current_year - 1 - candidate['year']) / 10)
+        if candidate['title_type'] == 'movie':
+            score += 0.02
+        # Tie-break on popularity so the well-known title wins among identical ones.
+        return score + 0.001 * math.log10((candidate['votes'] or 0) + 1)
+
+    def best_match(self, original_title, director='', runtime=None):
+        """The candidate confident enough to skip the live search, or None.
+
+        Requires a near-exact title and, when a director is given, a director
+        match; without one the title must be unambiguous.
+        """
+        candidates = self.lookup(original_title, director=director, runtime=runtime)
+        confident = [candidate for candidate in candidates if candidate['title_similarity'] >= MIN_TITLE_SIMILARITY]
+        if not confident:
+            return None
+        best = confident[0]
+        if director:
+            return best if best['director_score'] > 0 else None
+        return best if len(confident) == 1 else None
+
+    def close(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Build the offline IMDb title index from the TSV dumps.')
+    parser.add_argument('--dumps', required=True, help='Directory with title.basics, title.crew, name.basics '
+                                                       'and title.ratings (.tsv or .tsv.gz).')
+    parser.add_argument('--output', default=str(INDEX_PATH), help='SQLite file to write.')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+                        stream=sys.stderr)
+    start = time.perf_counter()
+    count = build_index(args.dumps, args.output)
+    print(f"Indexed {count} titles into {args.output} in {time.perf_counter() - start:.1f}s")
@@ -0,0 +1,144 @@
+"""Rank IMDb search results without loading each candidate's title page.
+
+Each result on the find page already shows its title, year, type and a cast
+snippet. Those are scored together with the Showcase director and duration
+and the release window (cinema listings are mostly recent releases). Only
+when the best scores are within `SCORE_MARGIN` of each other, or when several
+results share the exact title (remakes, classics re-released in cinemas, where
+the year would otherwise decide), are the close candidates' title pages
+fetched, for director and runtime, and re-scored.
+"""
+import re
+from datetime import date
+
+from imdb_index import director_score, normalize_key, similarity
+
+
+SCORE_MARGIN = 0.1
+MAX_DETAIL_CANDIDATES = 4
+RELEASE_WINDOW_YEARS = 1
+# IMDb and Showcase runtimes may differ by this much (credits, regional cuts) and still be the same film.
+DURATION_TOLERANCE_MINUTES = 10
+
+# A result's year line: "2025", or a series' run such as "2019–2023" or "2024–".
+YEAR_LINE = re.compile(r'((?:19|20)\d{2})(?:–(?:(?:19|20)\d{2})?)?')
+TITLE_TYPES = {
+    'tv series': 'tvSeries', 'tv mini series': 'tvMiniSeries', 'tv movie': 'tvMovie', 'tv episode': 'tvEpisode',
+    'tv special': 'tvSpecial', 'tv short': 'tvShort', 'short': 'short', 'video': 'video',
+    'video game': 'videoGame', 'music video': 'musicVideo', 'podcast series': 'podcastSeries',
+}
+TYPE_SCORES = {'movie': 0.1, 'tvMovie': 0.05, 'video': 0.03}
+
+
+def parse_candidate(url, title, text, position):
+    """Build a candidate from a find result: its title link, h3 text and the item's full text."""
+    year, title_type, credits = None, 'movie', []
+    for line in (text or '').splitlines():
+        line = line.strip()
+        year_match = YEAR_LINE.fullmatch(line)
+        if not line or line == title:
+            continue
+        if year_match:
+            year = year or int(year_match.group(1))
+        elif line.lower() in TITLE_TYPES:
+            title_type = TITLE_TYPES[line.lower()]
+        else:
+            credits.extend(name.strip() for name in line.split(',') if name.strip())
+    return {
+        'url': url,
+        'title': title,
+        'year': year,
+        'title_type': title_type,
+        'credits': credits,
+        'position': position,
+        'directors': None,
+        'runtime': None,
+    }
+
+
+def score_candidate(candidate, query, director='', showcase_minutes=None, today=None):
+    """Score a candidate; sets and returns its `score` and the `reasons` behind it."""
+    today = today or date.today()
+    reasons = []
+    title_similarity = similarity(normalize_key(query), normalize_key(candidate['title']))
+    score = 0.5 * title_similarity
+    reasons.append('exact title' if title_similarity == 1.0 else f'title {title_similarity:.2f}')
+
+    type_score = TYPE_SCORES.get(candidate['title_type'], 0.0)
+    score += type_score
+    if not type_score:
+        reasons.append(candidate['title_type'])
+
+    if candidate['year']:
+        distance = max(0, abs(today.year - candidate['year']) - RELEASE_WINDOW_YEARS)
+        score += 0.15 * max(0.0, 1 - distance / 10)
+        reasons.append(f"{candidate['year']}" + (' in release window' if not distance else ''))
+
+    if director:
+        names = candidate['directors'] if candidate['directors'] is not None else candidate['credits']
+        match = director_score(director, names)
+        score += 0.2 * match
+        if match:
+            source = 'title page' if candidate['directors'] is not None else 'snippet'
+            reasons.append(f"director {'full name' if match == 1.0 else 'surname'} ({source})")
+
+    if showcase_minutes and candidate['runtime']:
+        difference = abs(showcase_minutes - candidate['runtime'])
+        score += 0.1 * max(0.0, 1 - difference / 20) - (0.1 if difference > DURATION_TOLERANCE_MINUTES else 0.0)
+        reasons.append(f"runtime {candidate['runtime']}m vs {showcase_minutes}m")
+
+    # IMDb's own relevance order as a tie-break.
+    score += 0.05 / (1 + candidate['position'])
+    candidate['score'] = score
+    candidate['reasons'] = reasons
+    return score
+
+
+def rank_candidates(candidates, query, director='', showcase_minutes=None, today=None):
+    for candidate in candidates:
+        score_candidate(candidate, query, director, showcase_minutes, today)
+    return sorted(candidates, key=lambda candidate: candidate['score'], reverse=True)
+
+
+def close_candidates(ranked, query='', director='', showcase_minutes=None, margin=SCORE_MARGIN):
+    """The candidates whose title pages must settle the match, or [] when the best one is clear.
+
+    Those are the candidates within `margin` of the best score and, when a
+    director or runtime is known, every candidate with the exact title: the
+    snippets list cast rather than directors, so between a remake and the
+    original only the title pages tell which one is showing.
+    """
+    if len(ranked) < 2:
+        return []
+    query_key = normalize_key(query)
+    exact = [candidate for candidate in ranked if normalize_key(candidate['title']) == query_key]
+    if (director or showcase_minutes) and len(exact) > 1:
+        return exact[:MAX_DETAIL_CANDIDATES]
+    if ranked[0]['score'] - ranked[1]['score'] >= margin:
+        return []
+    return [candidate for candidate in ranked[:MAX_DETAIL_CANDIDATES]
+            if ranked[0]['score'] - candidate['score'] < margin]
+
+
+def choose_candidate(candidates, query, director='', showcase_minutes=None, fetch_details=None, today=None):
+    """Pick the best candidate, fetching details only for close calls.
+
+    `fetch_details(urls)` returns {url: {'directors': [...], 'runtime': minutes,
+    'year': year}} for the pages it could read. Returns (best, ranked, detailed)
+    where `detailed` tells whether title pages were needed; best is None when
+    there are no candidates.
+    """
+    ranked = rank_candidates(candidates, query, director, showcase_minutes, today)
+    close = close_candidates(ranked, query, director, showcase_minutes)
+    if not close or fetch_details is None:
+        return (ranked[0] if ranked else None), ranked, False
+
+    details = fetch_details([candidate['url'] for candidate in close])
+    for candidate in close:
+        found = details.get(candidate['url'])
+        if found:
+            candidate['directors'] = found.get('directors') or []
+            candidate['runtime'] = found.get('runtime')
+            candidate['year'] = found.get('year') or candidate['year']
+    ranked = rank_candidates(ranked, query, director, showcase_minutes, today)
+    return ranked[0], ranked, True
@@ -0,0 +1,84 @@
+"""Append-only journal of completed movie records, so an interrupted run can resume.
+
+The first line identifies the listing the run was scraping (its fingerprint);
+every following line is one completed record, flushed and fsynced as soon as it
+is written. A journal for a different listing is discarded on start. A torn last
+line from a crash mid-write is ignored.
+"""
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+
+
+JOURNAL_PATH = Path(__file__).resolve().parent / ".." / "scraper_journal.jsonl"
+
+
+class RunJournal:
+    def __init__(self, path=JOURNAL_PATH):
+        self.logger = logging.getLogger(__name__)
+        self.path = Path(path)
+        self._file = None
+        self._lock = threading.Lock()
+
+    def _read(self, fingerprint):
+        """Records of an existing journal for `fingerprint`, keyed by href, or None if there is none."""
+        if not self.path.exists():
+            return None
+        records = {}
+        with open(self.path, encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        try:
+            header = json.loads(lines[0]) if lines else {}
+        except json.JSONDecodeError:
+            return None
+        if header.get('fingerprint') != fingerprint:
+            return None
+        for line in lines[1:]:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            records[record['href']] = record
+        return records
+
+    def start(self, fingerprint, resume=False):
+        """Open the journal for a run; with `resume`, return the records already completed for this listing."""
+        records = self._read(fingerprint) if resume else None
+        if records is None:
+            if resume:
+                self.logger.info("No journal to resume for this listing; starting from the first movie.")
+            records = {}
+            self._file = open(self.path, 'w', encoding='utf-8')
+            self._write({'fingerprint': fingerprint, 'started_at': time.time()})
+        else:
+            self.logger.info("Resuming from the journal: %d movies already scraped.", len(records))
+            self._file = open(self.path, 'a', encoding='utf-8')
+            # Drop a torn last line so the next record starts on its own line.
+            if self.path.stat().st_size and not self.path.read_bytes().endswith(b'\n'):
+                self._file.write('\n')
+        return records
+
+    def _write(self, entry):
+        self._file.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def append(self, record):
+        """Durably record a completed movie; safe to call from worker threads."""
+        with self._lock:
+            if self._file is not None:
+                self._write(record)
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def discard(self):
+        """Remove the journal once its run has been saved."""
+        self.close()
+        self.path.unlink(missing_ok=True)
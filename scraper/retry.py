@@ -0,0 +1,134 @@
+"""Per-host health tracking: exponential backoff with jitter, Retry-After and circuit breakers."""
+import logging
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+
+BASE_DELAY_SECONDS = 1.0
+MAX_DELAY_SECONDS = 30.0
+FAILURES_BEFORE_OPEN = 3
+OPEN_SECONDS = 120.0
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a host whose circuit breaker is open."""
+
+
+class TransportError(Exception):
+    """A host could not be reached or did not answer in time.
+
+    Only these count against a host's health; a page that loads but cannot be
+    parsed is a problem of that page, not of the host.
+    """
+
+
+def backoff_delay(attempt, base=BASE_DELAY_SECONDS, cap=MAX_DELAY_SECONDS):
+    """Full-jitter exponential backoff for a zero-based attempt number."""
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+def parse_retry_after(value):
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date), or None."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class HostHealth:
+    """Failure tracking and circuit breaker for one host.
+
+    After `failures_before_open` consecutive failures the circuit opens for
+    `open_seconds`; callers should skip the host meanwhile. Once that elapses one
+    call goes through: success closes the circuit, failure reopens it.
+    """
+
+    def __init__(self, host, failures_before_open=FAILURES_BEFORE_OPEN, open_seconds=OPEN_SECONDS):
+        self.logger = logging.getLogger(__name__)
+        self.host = host
+        self.failures_before_open = failures_before_open
+        self.open_seconds = open_seconds
+        self.consecutive_failures = 0
+        self.failures = 0
+        self.successes = 0
+        self.times_opened = 0
+        self._opened_until = 0.0
+        self._not_before = 0.0
+        self._lock = threading.Lock()
+
+    def is_open(self):
+        return time.monotonic() < self._opened_until
+
+    def wait_seconds(self):
+        """How long until the host may be called again (open circuit or Retry-After)."""
+        return max(0.0, max(self._opened_until, self._not_before) - time.monotonic())
+
+    def delay(self, attempt):
+        """Backoff before retry `attempt`, never shorter than a pending Retry-After."""
+        return max(backoff_delay(attempt), self._not_before - time.monotonic())
+
+    def record_success(self):
+        with self._lock:
+            self.successes += 1
+            self.consecutive_failures = 0
+            self._opened_until = 0.0
+
+    def record_failure(self, retry_after=None):
+        now = time.monotonic()
+        with self._lock:
+            self.failures += 1
+            self.consecutive_failures += 1
+            if retry_after:
+                self._not_before = max(self._not_before, now + retry_after)
+            if self.consecutive_failures >= self.failures_before_open and now >= self._opened_until:
+                self._opened_until = now + self.open_seconds
+                self.times_opened += 1
+                self.logger.warning("Circuit opened for %s after %d consecutive failures; skipping it for %ds.",
+                                    self.host, self.consecutive_failures, self.open_seconds)
+
+    def snapshot(self):
+        return {
+            'successes': self.successes,
+            'failures': self.failures,
+            'consecutive_failures': self.consecutive_failures,
+            'times_opened': self.times_opened,
+            'open': self.is_open(),
+        }
+
+
+class HostRegistry:
+    """Thread-safe map of host and transport to HostHealth, shared by all scraper sessions.
+
+    The browser and plain HTTP clients are tracked separately: a host that
+    refuses `requests` (e.g. with 403s) may still serve the browser, and HTTP
+    helper failures must not open the circuit the browser path checks.
+    """
+
+    def __init__(self):
+        self._hosts = {}
+        self._lock = threading.Lock()
+
+    def get(self, url, transport='browser'):
+        host = urlparse(url).netloc or url
+        name = host if transport == 'browser' else f'{host} ({transport})'
+        with self._lock:
+            if name not in self._hosts:
+                self._hosts[name] = HostHealth(name)
+            return self._hosts[name]
+
+    def snapshot(self):
+        with self._lock:
+            return {host: health.snapshot() for host, health in self._hosts.items()}
+
+
+# Process-wide registry shared by every MovieScraper and the HTTP backend.
+host_health = HostRegistry()
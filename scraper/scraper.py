@@ -1,33 +1,79 @@
 from selenium import webdriver
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from urllib.parse import quote_plus
+from urllib.parse import parse_qs, quote_plus, urlparse
+import hashlib
 import json
+import os
 import sys
 from pathlib import Path
 import logging
 import argparse
+import asyncio
+import functools
+import queue
+from collections import deque
+import shutil
+import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 import re
-import unicodedata
+
+import requests
+
+from backends import HttpImdbBackend, HttpMovieBackend, USER_AGENT, format_imdb_duration, parse_listing_hrefs
+from daemon import (DEFAULT_INTERVAL_SECONDS, DEFAULT_MAX_SESSION_AGE_SECONDS, DEFAULT_MAX_SESSION_MEMORY_MB,
+                    DEFAULT_STATUS_PORT, ScraperDaemon, process_tree_rss_mb)
+from change_detection import diff_showtimes, probe_changed, with_content_hashes, write_diff_report
+from browser_profile import BLOCKED_RESOURCES, BrowserProfile, DEFAULT_BLOCKED_TYPES, cached_chromedriver_path
+from enrichment import ImdbEnricher
+from frontend_bundle import build_bundle
+from sinks import CompactJsonSink, DataJsonSink, NdjsonSink
+from retry import CircuitOpenError, TransportError, backoff_delay, host_health
+from telemetry import tracer
+from text_normalization import strip_accents
+from history_store import HISTORY_DB_PATH, HistoryStore
+from imdb_cache import CACHE_MODES, ImdbCache
+from imdb_index import INDEX_PATH, ImdbIndex
+from imdb_scoring import DURATION_TOLERANCE_MINUTES, choose_candidate, parse_candidate
+from journal import JOURNAL_PATH, RunJournal
 
 
 WORD_PATTERN = re.compile(r"([^\W\d_]+(?:['’][^\W\d_]+)*)", re.UNICODE)
 
 
-# Retry configuration
+# Retry configuration (delays come from per-host exponential backoff, see retry.py)
 MAX_RETRIES = 3
-RETRY_DELAY_SECONDS = 5
 CONSECUTIVE_FAILURES_BEFORE_RESTART = 3
 
-def _strip_accents(text: str) -> str:
-    """Remove diacritics from a piece of text."""
-    normalized = unicodedata.normalize("NFKD", text)
-    return "".join(char for char in normalized if not unicodedata.combining(char))
+# Overridable so the benchmark can point the scraper at a local stand-in server.
+IMDB_BASE_URL = "https://www.imdb.com"
+
+# Page script that extracts a whole movie record, including every day's showtimes.
+EXTRACT_MOVIE_SCRIPT = (Path(__file__).resolve().parent / "extract_movie.js").read_text(encoding="utf-8")
+SCRIPT_TIMEOUT_SECONDS = 120
+
+# Reads every IMDb find result (title link, h3 and full text) in one round trip.
+FIND_RESULTS_SCRIPT = """
+return Array.from(document.querySelectorAll(arguments[0])).map(item => {
+    const link = item.querySelector('a[href*="/title/tt"]');
+    const title = item.querySelector('h3');
+    return {href: link ? link.href : '', title: title ? title.innerText.trim() : '', text: item.innerText};
+});
+"""
 
+DATA_JSON_PATH = Path(__file__).resolve().parent / ".." / "docs" / "data.json"
+IMDB_CACHE_PATH = Path(__file__).resolve().parent / ".." / "docs" / "imdb_cache.json"
+CINEMAS_DIR = Path(__file__).resolve().parent / ".." / "docs" / "cinemas"
+BUNDLE_DIR = Path(__file__).resolve().parent / ".." / "docs" / "bundle"
+LISTING_FINGERPRINT_PATH = Path(__file__).resolve().parent / ".." / "docs" / "listing_fingerprint.json"
+
+DEFAULT_CINEMA_ID = '40212'
+LISTING_SELECTOR = '#cartelera_cine_{cinema_id} > .boxfilm > .afiche-pelicula > a'
 
 def _capitalize_word(word: str) -> str:
     """Capitalize the first alphabetical character in a word."""
@@ -54,7 +100,7 @@ def _normalize_word(token: str) -> str:
         # Strip accents so the normalized capitalization does not keep stray
         # diacritics in these situations.
         if has_internal_uppercase:
-            candidate = _strip_accents(candidate)
+            candidate = strip_accents(candidate)
 
     candidate = candidate.lower()
     return _capitalize_word(candidate)
@@ -69,6 +115,14 @@ def normalize_movie_title(title: str) -> str:
     stripped = title.strip()
     return WORD_PATTERN.sub(replace, stripped)
 
+def imdb_cache_key(original_title: str, director: str = '') -> str:
+    """Build the IMDb cache key: accent-free, case-folded, whitespace-collapsed."""
+    def normalize(text):
+        return " ".join(strip_accents(text).casefold().split())
+
+    return f"{normalize(original_title)}|{normalize(director)}"
+
+
 def convert_showcase_duration_to_minutes(duration_str):
     """Converts a duration string from '170 minutos' to an integer representing total minutes."""
     minutes = int(duration_str.split()[0])  # Split the string and convert the first part to an integer
@@ -87,134 +141,428 @@ def convert_imdb_duration_to_minutes(duration_str):
     return minutes
 
 
+def index_imdb_fields(match, showcase_minutes=None):
+    """IMDb fields from an offline index match; Metascore is not in the dumps."""
+    fields = {}
+    if match['runtime']:
+        fields['imdb_duration'] = format_imdb_duration(match['runtime'])
+    runtime_ok = (not (showcase_minutes and match['runtime']) or
+                  abs(showcase_minutes - match['runtime']) <= DURATION_TOLERANCE_MINUTES)
+    if match['rating'] is not None and runtime_ok:
+        fields['imdb_rating'] = f"{match['rating']:.1f}"
+    return fields
+
+
+BACKENDS = ('http', 'selenium')
+
+
 class MovieScraper:
-    def __init__(self, chromedriver_path=None):
+    def __init__(self, chromedriver_path=None, backend='http', imdb_cache=None, browser_profile=None,
+                 imdb_index=None, history=None):
         self.logger = logging.getLogger(__name__)
         self.chromedriver_path = chromedriver_path
+        self.backend_name = backend
+        self.imdb_cache = imdb_cache
+        self.imdb_index = imdb_index
+        self.last_imdb_index_match = None
+        self.history = history
+        self._imdb_http = None
+        # Journal of completed records for crash-safe heavy runs (set by the entry point).
+        self.journal = None
+        self.resume = False
+        self.browser_profile = browser_profile or BrowserProfile()
+        # Chrome profile directory kept across restarts so they start with a warm HTTP cache.
+        self._profile_dir = None
+        self._driver_started_at = None
+        # With keep_warm, pool sessions are parked here between runs instead of closed.
+        self.keep_warm = False
+        self.spare_sessions = []
         self.consecutive_failures = 0
-        self._init_driver()
+        self.restarts = 0
+        self.last_imdb_search_failed = False
+        # The WebDriver is started lazily, only when a page or field needs it.
+        self._driver = None
+        self.backend = HttpMovieBackend() if backend == 'http' else None
+
+    @property
+    def driver(self):
+        """The WebDriver session, started on first use."""
+        if self._driver is None:
+            self._init_driver()
+        return self._driver
 
     def _get_chrome_options(self):
         chrome_options = webdriver.ChromeOptions()
-        chrome_options.add_argument(
-            'user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+        chrome_options.add_argument(f'user-agent={USER_AGENT}')
         chrome_options.add_argument("--headless=new")
         chrome_options.add_argument("--disable-gpu")
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
+        if self._profile_dir is None:
+            self._profile_dir = tempfile.mkdtemp(prefix='scraper-chrome-')
+        chrome_options.add_argument(f"--user-data-dir={self._profile_dir}")
+        self.browser_profile.apply_options(chrome_options)
         return chrome_options
 
     def _init_driver(self):
         """Initialize or reinitialize the WebDriver."""
+        start = time.perf_counter()
+        with tracer.span('driver.startup'):
+            self._start_driver()
+        self.logger.info(f"WebDriver initialized in {time.perf_counter() - start:.2f}s.")
+
+    def _start_driver(self):
         try:
             self.logger.info("Initializing WebDriver...")
             if self.chromedriver_path:
                 self.logger.info(f"Using ChromeDriver from path: {self.chromedriver_path}")
                 service = Service(executable_path=self.chromedriver_path)
             else:
-                self.logger.info("Using ChromeDriver managed by ChromeDriverManager.")
-                service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=self._get_chrome_options())
-            self.driver.set_page_load_timeout(60)
-            self.logger.info("WebDriver initialized successfully.")
+                with tracer.span('driver.resolve'):
+                    service = Service(cached_chromedriver_path())
+            with tracer.span('driver.launch'):
+                self._driver = webdriver.Chrome(service=service, options=self._get_chrome_options())
+            self._driver_started_at = time.monotonic()
+            self._driver.set_page_load_timeout(60)
+            self._driver.set_script_timeout(SCRIPT_TIMEOUT_SECONDS)
+            self.browser_profile.apply_session(self._driver)
         except Exception as e:
             self.logger.error(f"Error initializing WebDriver: {e}")
             raise
 
     def _restart_driver(self):
-        """Restart the WebDriver after consecutive failures."""
+        """Restart the WebDriver after consecutive failures; returns whether it was restarted.
+
+        Without a running driver the failures were not the browser's: only the
+        counter is reset, and the `driver` property starts Chrome if a page needs it.
+        """
+        if self._driver is None:
+            self.consecutive_failures = 0
+            return False
         self.logger.warning("Restarting WebDriver due to consecutive failures...")
+        tracer.count('restarts')
         try:
-            self.driver.quit()
+            self._driver.quit()
         except Exception:
             pass
-        time.sleep(RETRY_DELAY_SECONDS)
+        self._driver = None
+        with tracer.span('driver.restart_sleep'):
+            time.sleep(backoff_delay(self.restarts))
+        self.restarts += 1
         self._init_driver()
         self.consecutive_failures = 0
+        return True
+
+    def driver_age_seconds(self):
+        return time.monotonic() - self._driver_started_at if self._driver is not None else 0.0
 
-    def scrape_movie_data(self, base_url):
-        self.driver.get(base_url)
-        WebDriverWait(self.driver, 15).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, '#cartelera_cine_40212 > .boxfilm > .afiche-pelicula > a'))
-        )
-        movies_links = self.driver.find_elements(By.CSS_SELECTOR, '#cartelera_cine_40212 > .boxfilm > '
-                                                                  '.afiche-pelicula > a')
+    def driver_memory_mb(self):
+        """Resident memory of chromedriver and its browser processes, or None if unknown."""
+        process = getattr(getattr(self._driver, 'service', None), 'process', None)
+        return process_tree_rss_mb(process.pid) if process is not None else None
+
+    def recycle_driver(self):
+        """Quit the browser; the next page load starts a fresh one with the same warm profile."""
+        tracer.count('recycles')
+        try:
+            if self._driver is not None:
+                self._driver.quit()
+        except Exception:
+            pass
+        self._driver = None
+
+    def recycle_over_budget(self, max_age_seconds, max_memory_mb):
+        """Recycle this session and its spares if they are older or bigger than the budget; returns how many."""
+        recycled = 0
+        for session in [self] + self.spare_sessions:
+            if session._driver is None:
+                continue
+            age = session.driver_age_seconds()
+            memory = session.driver_memory_mb()
+            if age > max_age_seconds or (memory is not None and memory > max_memory_mb):
+                self.logger.info(f"Recycling browser session (age {age / 60:.0f} min, "
+                                 f"memory {memory if memory is None else round(memory)} MB).")
+                session.recycle_driver()
+                recycled += 1
+        return recycled
+
+    def _load(self, url):
+        """Navigate the WebDriver to a URL, counted as a page load for its host.
+
+        Raises TransportError when the page does not load (timeout, network error).
+        """
+        driver = self.driver
+        tracer.count('page_loads', url)
+        with tracer.span('driver.get', url=url):
+            try:
+                driver.get(url)
+            except WebDriverException as exc:
+                raise TransportError(f"Loading {url} failed: {exc.msg}") from exc
+
+    def _wait_for(self, selector, timeout):
+        with tracer.span('driver.wait', selector=selector):
+            WebDriverWait(self.driver, timeout).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+            )
+
+    def scrape_movie_data(self, base_url, cinema_id=DEFAULT_CINEMA_ID):
+        listing_selector = LISTING_SELECTOR.format(cinema_id=cinema_id)
+        self._load(base_url)
+        self._wait_for(listing_selector, 15)
+        movies_links = self.driver.find_elements(By.CSS_SELECTOR, listing_selector)
         movie_hrefs = [link.get_attribute('href') for link in movies_links]
         return movie_hrefs
 
-    def scrape_movie_hrefs_only(self, base_url):
-        """Light scraping: only extract movie hrefs from the main page (fast check)."""
+    def scrape_movie_hrefs_only(self, base_url, cinema_id=DEFAULT_CINEMA_ID):
+        """Light scraping: only extract movie hrefs from the main page (fast check).
+
+        Tries a conditional HTTP request first and only starts the browser when
+        the HTTP path fails or the listing cannot be parsed from the static HTML.
+        """
+        hrefs = self.fetch_listing_hrefs(base_url, cinema_id) if self.backend else None
+        if hrefs is not None:
+            return hrefs
         # Reuse exact same logic as scrape_movie_data for reliability
-        return sorted(self.scrape_movie_data(base_url))
+        return sorted(self.scrape_movie_data(base_url, cinema_id))
+
+    def fetch_listing_hrefs(self, base_url, cinema_id=DEFAULT_CINEMA_ID):
+        """Fetch the sorted listing hrefs over HTTP, revalidating with the stored fingerprint.
+
+        Returns None when the browser is needed.
+        """
+        fingerprint = load_listing_fingerprint()
+        if fingerprint.get('url') != base_url or fingerprint.get('cinema_id') != cinema_id:
+            fingerprint = {}
+
+        headers = {}
+        if fingerprint.get('etag'):
+            headers['If-None-Match'] = fingerprint['etag']
+        if fingerprint.get('last_modified'):
+            headers['If-Modified-Since'] = fingerprint['last_modified']
+
+        try:
+            tracer.count('http_requests', base_url)
+            with tracer.span('http.listing', url=base_url):
+                response = self.backend.fetcher.get(base_url, headers=headers)
+        except requests.RequestException as e:
+            self.logger.warning(f"HTTP listing check failed, falling back to the browser: {e}")
+            return None
+
+        if response.status_code == 304:
+            self.logger.info("Listing not modified since the last check (HTTP 304).")
+            return fingerprint['hrefs']
+
+        hrefs = sorted(parse_listing_hrefs(response.text, base_url, LISTING_SELECTOR.format(cinema_id=cinema_id)))
+        if not hrefs:
+            self.logger.warning("No movies found in the static listing HTML, falling back to the browser.")
+            return None
+
+        hrefs_hash = hash_hrefs(hrefs)
+        if hrefs_hash == fingerprint.get('hrefs_hash'):
+            self.logger.info("Listing page changed but its movies did not.")
+        save_listing_fingerprint({
+            'url': base_url,
+            'cinema_id': cinema_id,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'hrefs_hash': hrefs_hash,
+            'hrefs': hrefs,
+        })
+        return hrefs
+
+    def fetch_cinema_listings(self, base_url, cinema_ids):
+        """Fetch the listing page once over HTTP and read each cinema's hrefs from it, in listing order.
 
-    def scrape_movie_details_with_retry(self, href):
+        Returns {cinema_id: hrefs} for the cinemas found in the static HTML;
+        the others need the browser.
+        """
+        if not self.backend:
+            return {}
+        try:
+            tracer.count('http_requests', base_url)
+            with tracer.span('http.listing', url=base_url):
+                response = self.backend.fetcher.get(base_url)
+        except requests.RequestException as e:
+            self.logger.warning(f"HTTP listing fetch failed, falling back to the browser: {e}")
+            return {}
+        listings = {}
+        for cinema_id in cinema_ids:
+            hrefs = parse_listing_hrefs(response.text, base_url, LISTING_SELECTOR.format(cinema_id=cinema_id))
+            if hrefs:
+                listings[cinema_id] = hrefs
+        return listings
+
+    def scrape_movie_details_with_retry(self, href, attempts=MAX_RETRIES):
         """Scrape movie details with retry logic and driver restart on consecutive failures."""
+        return self._with_retry(self.scrape_movie_details, href, attempts)
+
+    def scrape_showcase_details_with_retry(self, href, attempts=MAX_RETRIES):
+        """Scrape the Showcase part of a movie with the same retry and restart logic."""
+        return self._with_retry(self.scrape_showcase_details, href, attempts)
+
+    def scrape_movie_showtimes_with_retry(self, href, attempts=MAX_RETRIES):
+        """Refresh a movie's showtimes with the same retry and restart logic."""
+        return self._with_retry(self.scrape_movie_showtimes, href, attempts)
+
+    def _with_retry(self, scrape, href, attempts=MAX_RETRIES):
+        """Call `scrape(href)` with per-host backoff between attempts.
+
+        A single attempt (the first pass of a run) never waits: if the host's
+        circuit is open it raises CircuitOpenError so the movie can be deferred.
+        Only TransportErrors count against the host; other failures only
+        against this movie.
+        """
+        health = host_health.get(href)
         last_error = None
         
-        for attempt in range(MAX_RETRIES):
+        for attempt in range(attempts):
+            wait = health.wait_seconds()
+            if wait and attempts == 1:
+                raise CircuitOpenError(f"{health.host} is unavailable for {wait:.0f}s more")
+            if wait:
+                with tracer.span('retry_sleep'):
+                    time.sleep(wait)
             try:
-                result = self.scrape_movie_details(href)
+                result = scrape(href)
                 self.consecutive_failures = 0  # Reset on success
+                health.record_success()
                 return result
             except Exception as e:
                 last_error = e
                 self.consecutive_failures += 1
-                self.logger.warning(f"Attempt {attempt + 1}/{MAX_RETRIES} failed for {href}: {e}")
+                if isinstance(e, TransportError):
+                    health.record_failure()
+                self.logger.warning(f"Attempt {attempt + 1}/{attempts} failed for {href}: {e}")
+                tracer.count('retries', href)
                 
                 # Restart driver if too many consecutive failures
-                if self.consecutive_failures >= CONSECUTIVE_FAILURES_BEFORE_RESTART:
-                    self._restart_driver()
-                elif attempt < MAX_RETRIES - 1:
-                    time.sleep(RETRY_DELAY_SECONDS)
+                restarted = (self.consecutive_failures >= CONSECUTIVE_FAILURES_BEFORE_RESTART
+                             and self._restart_driver())
+                if not restarted and attempt < attempts - 1:
+                    with tracer.span('retry_sleep'):
+                        time.sleep(health.delay(attempt))
         
         # All retries failed
         raise last_error
 
+    def fetch_showcase_page(self, href):
+        """Extract a movie page over HTTP, using the browser only where needed.
+
+        Returns the page fields and the list of parts that needed Selenium.
+        """
+        page = self.backend.fetch_movie(href) if self.backend else None
+        if page is None:
+            # The fast path could not handle this page: load all of it in the browser.
+            return self._scrape_showcase_page(href), ['page']
+        if page['showtimes'] is None:
+            # Static fields came over HTTP; the per-day showtimes need the AJAX calls.
+            page['showtimes'] = self._scrape_showcase_page(href)['showtimes']
+            return page, ['showtimes']
+        return page, []
+
+    def iter_movies(self, movie_hrefs, workers=1, showtimes_only=False, logger=None):
+        """Yield movie records as they are scraped, across a pool of `workers` sessions, without keeping them.
+
+        Records come in listing order, except hrefs that failed their first
+        attempt, which come last, after the retry pass. With `showtimes_only`,
+        each record holds just the href, showing days and showtimes.
+        """
+        logger = logger or self.logger
+        total = len(movie_hrefs)
+        positions = {href: idx for idx, href in enumerate(movie_hrefs, 1)}
+        action = "Refreshing showtimes" if showtimes_only else "Scraping movie"
+
+        def scrape(worker, href, attempts):
+            logger.info(f"{action} {positions[href]}/{total}: {href}")
+            with tracer.movie(href):
+                if showtimes_only:
+                    return worker.scrape_movie_showtimes_with_retry(href, attempts)
+                return worker.scrape_movie_details_with_retry(href, attempts)
+
+        pool = ScraperPool.from_scraper(self, max(1, min(workers, total)))
+        try:
+            for _, record in pool.iter_with_retry_pass(scrape, movie_hrefs, logger):
+                yield record
+        finally:
+            pool.close()
+
+    def scrape_movie_showtimes(self, href):
+        """Scrape only the showing days and showtimes of a movie page."""
+        page, selenium_fallback = self.fetch_showcase_page(href)
+        return {
+            'href': href,
+            'showing_days': page['showing_days'],
+            'showtimes': page['showtimes'],
+            'selenium_fallback': selenium_fallback,
+        }
+
     def scrape_movie_details(self, href):
-        self.driver.get(href)
-        WebDriverWait(self.driver, 15).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, '.op_format'))
-        )
-        title = self.driver.find_element(By.CSS_SELECTOR, '.movie-info-box .name > strong').text
-        title = normalize_movie_title(title)
-        poster_url = self.driver.find_element(By.CSS_SELECTOR, '.movie-side-info-box figure > img').get_attribute('src')
-        original_title = self.driver.find_element(By.CSS_SELECTOR, '.movie-side-info-box ul > li:first-of-type').text
-        original_title = original_title.replace('Título Original: ', '')  # Remove the prefix
-        duration = self.driver.find_element(By.CSS_SELECTOR, '.movie-info-box ul.features .year').text
-        showing_days = [button.get_attribute('value') for button in
-                        self.driver.find_elements(By.CSS_SELECTOR, '.movie-info-box .op_days > button')]
-
-        showtimes_by_format = self.extract_showtimes()
-
-        # Extract director from side info box
-        director = ''
-        for li in self.driver.find_elements(By.CSS_SELECTOR, '.movie-side-info-box ul > li'):
-            if 'Director:' in li.text:
-                director = li.text.replace('Director:', '').strip()
-                break
+        movie_info, director = self.scrape_showcase_details(href)
+        movie_info.update(self.scrape_imdb_fields(movie_info['original_title'], director, movie_info['duration']))
+        return movie_info
+
+    def scrape_showcase_details(self, href):
+        """Scrape a movie's Showcase fields. Returns the record (without IMDb fields) and its director."""
+        page, selenium_fallback = self.fetch_showcase_page(href)
 
+        original_title = page['original_title']
         movie_info = {
-            'title': title,
+            'title': normalize_movie_title(page['title']),
             'href': href,
             'original_title': original_title,
-            'poster_url': poster_url,
-            'duration': duration,
-            'showing_days': showing_days,
-            'showtimes': showtimes_by_format
+            'poster_url': page['poster_url'],
+            'duration': page['duration'],
+            'showing_days': page['showing_days'],
+            'showtimes': page['showtimes'],
+            'selenium_fallback': selenium_fallback,
         }
+        return movie_info, page['director']
 
+    def scrape_imdb_fields(self, original_title, director, showcase_duration):
+        """Resolve the IMDb URL and scrape its rating, metascore and duration."""
+        try:
+            showcase_minutes = convert_showcase_duration_to_minutes(showcase_duration)
+        except (ValueError, AttributeError, IndexError):
+            showcase_minutes = None
         # Fetch the IMDb URL using the original title and director for disambiguation
-        imdb_url = self.get_imdb_url(original_title, director=director)
+        imdb_url = self.resolve_imdb_url(original_title, director=director, runtime=showcase_minutes)
         # Fetch additional IMDb information (rating and votes)
-        imdb_info = self.scrape_imdb_info(imdb_url, movie_info['duration'])
-
-        # Update movie_info dictionary to include the IMDb URL and additional IMDb information
-        movie_info.update({
+        imdb_info = self.scrape_imdb_info(imdb_url, showcase_duration)
+        if self.last_imdb_index_match is not None:
+            # The title page could not be read (e.g. IMDb's circuit is open): use the dump's values.
+            for field, value in index_imdb_fields(self.last_imdb_index_match, showcase_minutes).items():
+                if imdb_info.get(field) == 'N/A':
+                    imdb_info[field] = value
+        return {
             'imdb_url': imdb_url,
             **imdb_info  # This unpacks the imdb_info dictionary and adds its keys and values to movie_info
-        })
+        }
 
-        return movie_info
+    @classmethod
+    def missing_imdb_fields(cls, movie_info):
+        """IMDb fields for a movie whose enrichment failed, as if no title had been found."""
+        return {
+            'imdb_url': cls._build_imdb_search_url(movie_info['original_title']),
+            'imdb_rating': 'N/A',
+            'metascore': 'N/A',
+            'imdb_duration': 'N/A',
+        }
+
+    def _scrape_showcase_page(self, href):
+        """Extract the Showcase fields of a movie page through the WebDriver.
+
+        The whole record, including every day's format/time grid, is collected
+        by a single injected script instead of one WebDriver call per element.
+        """
+        self._load(href)
+        return self._run_extraction_script()
+
+    def _run_extraction_script(self):
+        with tracer.span('extract.script'):
+            page = self.driver.execute_async_script(EXTRACT_MOVIE_SCRIPT)
+        if not page or 'error' in page:
+            raise RuntimeError(f"Movie page extraction failed: {(page or {}).get('error', 'no result')}")
+        return page
 
     @staticmethod
     def _build_imdb_search_url(original_title: str) -> str:
@@ -222,22 +570,40 @@ class MovieScraper:
         if not query:
             return "IMDb URL not found"
 
-        return "https://www.imdb.com/find/?q=" + quote_plus(query) + "&s=tt&ttype=ft"
+        return f"{IMDB_BASE_URL}/find/?q=" + quote_plus(query) + "&s=tt&ttype=ft"
 
     def _extract_imdb_id_url(self, href):
         """Extract a clean IMDb title URL from a raw href."""
         match = re.search(r'/title/(tt\d+)', href)
         if match:
-            return f"https://www.imdb.com/title/{match.group(1)}/"
+            return f"{IMDB_BASE_URL}/title/{match.group(1)}/"
         return None
 
     def _verify_imdb_director(self, imdb_url, director):
         """Visit an IMDb title page and check if the director matches."""
+        with tracer.span('imdb.verify_director', url=imdb_url):
+            return self._check_imdb_director(imdb_url, director)
+
+    def _load_imdb_page(self, url, selector):
+        """Load an IMDb page and wait for `selector`, tracking IMDb's health.
+
+        Raises CircuitOpenError without loading anything while IMDb's circuit is
+        open, so the run degrades to Showcase-only data instead of waiting.
+        """
+        health = host_health.get(url)
+        if health.is_open():
+            raise CircuitOpenError(f"{health.host} circuit is open")
         try:
-            self.driver.get(imdb_url)
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, '[data-testid="hero__pageTitle"]'))
-            )
+            self._load(url)
+            self._wait_for(selector, 10)
+        except Exception:
+            health.record_failure()
+            raise
+        health.record_success()
+
+    def _check_imdb_director(self, imdb_url, director):
+        try:
+            self._load_imdb_page(imdb_url, '[data-testid="hero__pageTitle"]')
             # The principal credits section lists Director, Writer, Stars
             credits_text = self.driver.find_element(By.CSS_SELECTOR, 'main').text
             # Compare using the director's last name to handle minor differences
@@ -248,77 +614,94 @@ class MovieScraper:
             self.logger.warning("Director verification failed for %s: %s", imdb_url, exc)
             return False
 
-    def get_imdb_url(self, original_title, director='', max_retries=2):
+    def resolve_imdb_url(self, original_title, director='', runtime=None):
+        """Resolve the IMDb URL through the offline index or the on-disk cache, searching IMDb on a miss."""
+        self.last_imdb_index_match = None
+        if self.imdb_index is not None:
+            match = self.imdb_index.best_match(original_title, director=director, runtime=runtime)
+            tracer.count('imdb_index_hits' if match else 'imdb_index_misses')
+            if match:
+                self.logger.info("IMDb index match for '%s': %s (%s)", original_title, match['tconst'], match['year'])
+                self.last_imdb_index_match = match
+                return f"{IMDB_BASE_URL}/title/{match['tconst']}/"
+
+        if self.imdb_cache is None:
+            return self.get_imdb_url(original_title, director=director, runtime=runtime)
+
+        key = imdb_cache_key(original_title, director)
+        hit, url = self.imdb_cache.get(key)
+        tracer.count('imdb_cache_hits' if hit else 'imdb_cache_misses')
+        if hit:
+            self.logger.info("IMDb cache hit for '%s': %s", original_title, url)
+            return url
+
+        url = self.get_imdb_url(original_title, director=director, runtime=runtime)
+        # Searches that failed outright are retried next run instead of cached as "not found".
+        if not self.last_imdb_search_failed:
+            self.imdb_cache.put(key, url, found=url.startswith(f'{IMDB_BASE_URL}/title/tt'))
+        return url
+
+    def get_imdb_url(self, original_title, director='', max_retries=2, runtime=None):
+        with tracer.span('imdb.search', title=original_title):
+            return self._search_imdb_url(original_title, director, max_retries, runtime)
+
+    def _fetch_candidate_details(self, urls, director):
+        """Directors, runtime and year of candidate title pages, fetched over HTTP in parallel.
+
+        When no page can be read over HTTP, falls back to checking the director
+        of each candidate in the browser.
+        """
+        if self._imdb_http is None:
+            self._imdb_http = HttpImdbBackend()
+        with tracer.span('imdb.candidate_details'), ThreadPoolExecutor(max_workers=len(urls)) as executor:
+            details = dict(zip(urls, executor.map(self._imdb_http.fetch_details, urls)))
+        if any(details.values()) or not director:
+            return {url: found for url, found in details.items() if found}
+        return {url: {'directors': [director] if self._verify_imdb_director(url, director) else []}
+                for url in urls}
+
+    def _search_imdb_url(self, original_title, director, max_retries, runtime=None):
+        self.last_imdb_search_failed = False
         search_url = self._build_imdb_search_url(original_title)
         if search_url == "IMDb URL not found":
             return search_url
 
+        imdb = host_health.get(search_url)
         for attempt in range(max_retries):
             try:
-                self.driver.get(search_url)
-                WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, '[data-testid="find-results-section-title"]'))
-                )
+                self._load_imdb_page(search_url, '[data-testid="find-results-section-title"]')
 
                 item_selector = '[data-testid="find-results-section-title"] .ipc-metadata-list-summary-item'
-                results = self.driver.find_elements(By.CSS_SELECTOR, item_selector)
-
-                fallback_href = None
-                exact_matches = []
-                query_lower = original_title.strip().lower()
-
-                for result in results:
-                    try:
-                        link = result.find_element(By.CSS_SELECTOR, 'a[href*="/title/tt"]')
-                        href = link.get_attribute('href')
-                        if not href or '/title/tt' not in href:
-                            continue
-
-                        if fallback_href is None:
-                            fallback_href = href
-
-                        title_el = result.find_element(By.CSS_SELECTOR, 'h3')
-                        if title_el.text.strip().lower() == query_lower:
-                            exact_matches.append(href)
-                    except Exception:
-                        continue
-
-                # Single exact match or no director to verify: use first exact match
-                if exact_matches and (len(exact_matches) == 1 or not director):
-                    url = self._extract_imdb_id_url(exact_matches[0])
-                    if url:
-                        return url
-
-                # Multiple exact matches with director: verify each candidate
-                if len(exact_matches) > 1 and director:
-                    self.logger.info(
-                        "Multiple exact matches for '%s', verifying director '%s'",
-                        original_title, director
-                    )
-                    for href in exact_matches:
-                        candidate_url = self._extract_imdb_id_url(href)
-                        if candidate_url and self._verify_imdb_director(candidate_url, director):
-                            self.logger.info("Director match found: %s", candidate_url)
-                            return candidate_url
-                    # No director match — fall back to first exact match
-                    url = self._extract_imdb_id_url(exact_matches[0])
-                    if url:
-                        return url
-
-                # No exact match — use first result
-                if fallback_href:
-                    url = self._extract_imdb_id_url(fallback_href)
-                    if url:
-                        return url
-
+                candidates = {}
+                for item in self.driver.execute_script(FIND_RESULTS_SCRIPT, item_selector) or []:
+                    url = self._extract_imdb_id_url(item.get('href') or '')
+                    if url and url not in candidates:
+                        candidates[url] = parse_candidate(url, item['title'], item['text'], len(candidates))
+
+                # Rank from the result snippets; title pages are only read for close calls.
+                best, ranked, detailed = choose_candidate(
+                    list(candidates.values()), original_title, director=director, showcase_minutes=runtime,
+                    fetch_details=lambda urls: self._fetch_candidate_details(urls, director))
+                if best is not None:
+                    runner_up = f"; runner-up {ranked[1]['url']} {ranked[1]['score']:.2f}" if len(ranked) > 1 else ""
+                    self.logger.info("IMDb match for '%s': %s score %.2f (%s)%s%s", original_title, best['url'],
+                                     best['score'], ", ".join(best['reasons']),
+                                     " after reading title pages" if detailed else "", runner_up)
+                    return best['url']
                 return search_url
+            except CircuitOpenError:
+                self.logger.info("Skipping IMDb search for '%s': IMDb circuit is open", original_title)
+                break
             except Exception as exc:
                 self.logger.warning(
                     "IMDb search attempt %d/%d failed for '%s': %s",
                     attempt + 1, max_retries, original_title, exc
                 )
+                tracer.count('retries', search_url)
                 if attempt < max_retries - 1:
-                    time.sleep(2)  # Wait before retry
+                    with tracer.span('retry_sleep'):
+                        time.sleep(imdb.delay(attempt))  # Wait before retry
+        self.last_imdb_search_failed = True
         return search_url
 
     def scrape_imdb_info(self, imdb_url, showcase_duration):
@@ -327,20 +710,23 @@ class MovieScraper:
         Duration validation: accepts if within 5 minutes tolerance.
         This helps match movies where Showcase/IMDb have slight duration differences.
         """
-        if not imdb_url.startswith('https://www.imdb.com/title/tt'):
-            if imdb_url.startswith('https://www.imdb.com/find/?q='):
+        with tracer.span('imdb.title', url=imdb_url):
+            return self._scrape_imdb_title(imdb_url, showcase_duration)
+
+    def _scrape_imdb_title(self, imdb_url, showcase_duration):
+        if not imdb_url.startswith(f'{IMDB_BASE_URL}/title/tt'):
+            if imdb_url.startswith(f'{IMDB_BASE_URL}/find/?q='):
                 self.logger.info("Skipping IMDb scraping for search URL: %s", imdb_url)
             else:
                 self.logger.error("Invalid IMDb URL: %s", imdb_url)
             return {'imdb_rating': 'N/A', 'metascore': 'N/A', 'imdb_duration': 'N/A'}
         
-        self.driver.get(imdb_url)
         imdb_info = {'imdb_rating': 'N/A', 'metascore': 'N/A', 'imdb_duration': 'N/A'}
 
         try:
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, '[data-testid="hero__pageTitle"]'))
-            )
+            # Title page failures stay IMDb failures: they no longer count against
+            # the Showcase retries or restart the browser.
+            self._load_imdb_page(imdb_url, '[data-testid="hero__pageTitle"]')
             
             # Get IMDb duration
             try:
@@ -363,8 +749,8 @@ class MovieScraper:
                 self.logger.warning("Could not parse duration: %s", e)
                 duration_diff = 999  # Force mismatch
             
-            # Accept if durations are within 10 minutes (accounts for credits, regional cuts, etc.)
-            if duration_diff <= 10:
+            # Accept if durations are within the tolerance (accounts for credits, regional cuts, etc.)
+            if duration_diff <= DURATION_TOLERANCE_MINUTES:
                 self._scrape_ratings(imdb_info)
             else:
                 self.logger.warning(
@@ -397,102 +783,655 @@ class MovieScraper:
             pass
 
     def extract_showtimes(self):
-        showtimes = {}
-        # Find all day selectors and iterate through them
-        day_selectors = self.driver.find_elements(By.CSS_SELECTOR, '.movie-info-box #op_container .op_days .op_day')
-        for day_selector in day_selectors:
-            # Extract the date from the day_selector, assuming it's in a format you can use directly
-            date = day_selector.get_attribute('value')  # Adjust attribute name as necessary
-
-            # Click the day selector to load the showtimes for that day
-            self.driver.execute_script("arguments[0].click();", day_selector)
-
-            # Wait for the showtimes to be loaded. Adjust the wait condition as needed.
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, '.op_format'))
-            )
-
-            # Now, extract the showtimes for this day. This part depends on your page structure.
-            # You might need to first group by format, then extract times.
-            showtimes_for_day = {}
-            format_elements = self.driver.find_elements(By.CSS_SELECTOR, '.op_format')
-            for format_element in format_elements:
-                format_type = format_element.get_attribute('innerHTML').strip()
-                time_container = format_element.find_element(By.XPATH, './following-sibling::div')
-                time_elements = time_container.find_elements(By.CSS_SELECTOR, 'button.op_perf')
-                times = [time_element.get_attribute('innerHTML').strip() for time_element in time_elements]
-                showtimes_for_day[format_type] = times
-
-            # Add the showtimes for the day to the main dictionary
-            showtimes[date] = showtimes_for_day
-
-            # Add any necessary logic to handle navigation or refresh issues between clicks
-
-        return showtimes
+        """Extract the showtimes of every day from the movie page currently loaded."""
+        return self._run_extraction_script()['showtimes']
 
     def close(self):
-        self.driver.quit()
+        while self.spare_sessions:
+            self.spare_sessions.pop().close()
+        if self._driver is not None:
+            self._driver.quit()
+            self._driver = None
+        if self.backend is not None:
+            self.backend.close()
+        if self._imdb_http is not None:
+            self._imdb_http.close()
+        if self._profile_dir is not None:
+            shutil.rmtree(self._profile_dir, ignore_errors=True)
+            self._profile_dir = None
 
     def save_data_to_json(self, data):
-        """Saves the scraped data to a JSON file."""
-        base_dir = Path(__file__).resolve().parent  # Get the directory of the current script
-        json_path = base_dir / ".." / "docs" / "data.json"  # Construct the dynamic path to data.json
+        """Saves the scraped data to a JSON file.
 
-        with open(json_path, 'w') as jsonfile:
-            json.dump(data, jsonfile, indent=4)
+        With a history store, the run is recorded there first and data.json is
+        exported from it.
+        """
+        if self.history is not None:
+            run_id = self.history.record_run(data)
+            if run_id is not None:
+                self.logger.info("Recorded run %d in the history store.", run_id)
+            data = self.history.export_movies()
+        data = [with_content_hashes(movie) for movie in data]
+
+        # Skip unchanged content: no empty commits and no frontend cache busts.
+        payload = json.dumps(data, indent=4).encode('utf-8')
+        if DATA_JSON_PATH.exists() and (BUNDLE_DIR / 'manifest.json').exists() and \
+                hashlib.sha256(DATA_JSON_PATH.read_bytes()).digest() == hashlib.sha256(payload).digest():
+            self.logger.info("data.json is unchanged; skipping the write.")
+            return False
 
-    @staticmethod
-    def get_existing_hrefs():
-        """Load existing movie hrefs from data.json."""
-        base_dir = Path(__file__).resolve().parent
-        json_path = base_dir / ".." / "docs" / "data.json"
-        
-        if not json_path.exists():
+        # Written to a temporary file and renamed, so an interrupted write never leaves a torn data.json.
+        tmp_path = DATA_JSON_PATH.with_suffix(DATA_JSON_PATH.suffix + '.tmp')
+        with open(tmp_path, 'wb') as jsonfile:
+            jsonfile.write(payload)
+            jsonfile.flush()
+            os.fsync(jsonfile.fileno())
+        os.replace(tmp_path, DATA_JSON_PATH)
+
+        # Per-day shards the frontend loads instead of the whole data.json.
+        manifest = build_bundle(data, BUNDLE_DIR)
+        self.logger.info("Frontend bundle %s written with %d days.", manifest['version'], len(manifest['dates']))
+        return True
+
+    def save_cinema_shards(self, shards, index):
+        """Write one data.json-shaped file per cinema plus the combined index."""
+        CINEMAS_DIR.mkdir(parents=True, exist_ok=True)
+        for cinema_id, movies in shards.items():
+            with open(CINEMAS_DIR / f"{cinema_id}.json", 'w') as jsonfile:
+                json.dump(movies, jsonfile, indent=4)
+        with open(CINEMAS_DIR / "index.json", 'w') as jsonfile:
+            json.dump(index, jsonfile, indent=4)
+
+    def get_existing_hrefs(self):
+        """Load existing movie hrefs from the history store (an indexed query) or data.json."""
+        if self.history is not None and not self.history.is_empty():
+            return self.history.current_hrefs()
+        return sorted([movie.get('href', '') for movie in self.get_existing_movies()])
+
+    def get_existing_movies(self):
+        """Load existing movie records from the history store or data.json."""
+        if self.history is not None and not self.history.is_empty():
+            return self.history.export_movies()
+        if not DATA_JSON_PATH.exists():
             return []
         
         try:
-            with open(json_path, 'r') as f:
-                data = json.load(f)
-            return sorted([movie.get('href', '') for movie in data])
-        except (json.JSONDecodeError, KeyError):
+            with open(DATA_JSON_PATH, 'r') as f:
+                return json.load(f)
+        except json.JSONDecodeError:
             return []
 
 
-MIN_SUCCESS_RATE = 0.5  # Don't save if less than 50% of movies scraped successfully
+# Items each pool session may have in flight or buffered in ScraperPool.map.
+MAP_WINDOW_PER_SESSION = 4
 
-def run_heavy_scraping(scraper, base_url, logger):
-    """Run full scraping: titles, details, showtimes, and IMDb data."""
-    movie_hrefs = scraper.scrape_movie_data(base_url)
-    all_movies_details = []
 
-    for idx, href in enumerate(movie_hrefs, 1):
+class ScraperPool:
+    """A bounded pool of MovieScrapers, each with its own WebDriver session.
+
+    Every scraper keeps its own `consecutive_failures` counter and restarts its
+    own driver, so one crashed session does not affect the others.
+    """
+
+    def __init__(self, scrapers):
+        self.scrapers = list(scrapers)
+        self._owned = []
+        self._parent = None
+        self._idle = queue.Queue()
+        for scraper in self.scrapers:
+            self._idle.put(scraper)
+
+    @classmethod
+    def from_scraper(cls, scraper, size, include_scraper=True):
+        """Build a pool of `size` sessions configured like `scraper`, which joins the pool unless told otherwise.
+
+        Spare sessions parked on a `keep_warm` scraper are reused before new ones are started.
+        """
+        siblings = [scraper.spare_sessions.pop() if scraper.spare_sessions else
+                    type(scraper)(chromedriver_path=scraper.chromedriver_path, backend=scraper.backend_name,
+                                  imdb_cache=scraper.imdb_cache, browser_profile=scraper.browser_profile,
+                                  imdb_index=scraper.imdb_index)
+                    for _ in range(size - 1 if include_scraper else size)]
+        pool = cls(([scraper] if include_scraper else []) + siblings)
+        pool._owned = siblings
+        pool._parent = scraper
+        return pool
+
+    @contextmanager
+    def acquire(self):
+        scraper = self._idle.get()
         try:
-            logger.info(f"Scraping movie {idx}/{len(movie_hrefs)}: {href}")
-            movie_details = scraper.scrape_movie_details_with_retry(href)
-            all_movies_details.append(movie_details)
-            print(movie_details)
-        except Exception as e:
-            logger.error(f"Failed to scrape movie {href}: {e}")
-            continue
+            yield scraper
+        finally:
+            self._idle.put(scraper)
+
+    def map(self, func, items):
+        """Run `func(scraper, item)` across the pool, yielding (item, result, error) in input order.
+
+        At most MAP_WINDOW_PER_SESSION items per session are in flight or waiting
+        to be yielded, so memory stays bounded however many items there are.
+        """
+        def run(item):
+            with self.acquire() as scraper:
+                return func(scraper, item)
+
+        def next_result():
+            item, future = pending.popleft()
+            try:
+                return item, future.result(), None
+            except Exception as e:
+                return item, None, e
+
+        window = MAP_WINDOW_PER_SESSION * len(self.scrapers)
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=len(self.scrapers)) as executor:
+            for item in items:
+                pending.append((item, executor.submit(run, item)))
+                if len(pending) >= window:
+                    yield next_result()
+            while pending:
+                yield next_result()
+
+    def iter_with_retry_pass(self, func, items, logger):
+        """Run `func(scraper, item, attempts)` in two passes, yielding (item, result) as they succeed.
+
+        The first pass makes a single attempt per item, so a failing item does not
+        hold a session while it backs off; failures are deferred to a second
+        pass at the end that retries them with the full backoff. First-pass
+        results come in input order, deferred ones after them.
+        """
+        deferred = []
+        for item, result, error in self.map(lambda scraper, item: func(scraper, item, 1), items):
+            if error is not None:
+                logger.warning(f"Deferring {item} to the retry pass: {error}")
+                deferred.append(item)
+            else:
+                yield item, result
+
+        if deferred:
+            logger.info(f"Retry pass for {len(deferred)} deferred items...")
+            for item, result, error in self.map(lambda scraper, item: func(scraper, item, MAX_RETRIES), deferred):
+                if error is not None:
+                    logger.error(f"Failed to scrape movie {item}: {error}")
+                else:
+                    yield item, result
+
+    def map_with_retry_pass(self, func, items, logger):
+        """Like `iter_with_retry_pass`, but return the successful results in input order."""
+        results = dict(self.iter_with_retry_pass(func, items, logger))
+        return [results[item] for item in items if item in results]
+
+    def close(self):
+        """Close the sessions the pool created; the caller closes the scraper it passed in.
+
+        Sessions of a `keep_warm` scraper's pool are parked on it instead, still running.
+        """
+        if self._parent is not None and self._parent.keep_warm:
+            self._parent.spare_sessions.extend(self._owned)
+            self._owned = []
+            return
+        for scraper in self._owned:
+            try:
+                scraper.close()
+            except Exception:
+                pass
+
+
+def scrape_movies(scraper, movie_hrefs, logger, workers=1, showtimes_only=False, imdb_workers=0, on_result=None):
+    """Scrape the details of every href, in order, skipping the ones that fail.
+
+    With `showtimes_only`, each result holds just the refreshed showing days and showtimes.
+    With `imdb_workers`, IMDb data is filled in by a separate pipelined stage.
+    `on_result(record)` is called as each record completes.
+    """
+    if imdb_workers and not showtimes_only:
+        return asyncio.run(scrape_movies_pipelined(scraper, movie_hrefs, logger, workers, imdb_workers,
+                                                   on_result=on_result))
+
+    scraped = {}
+    for movie_details in scraper.iter_movies(movie_hrefs, workers=workers, showtimes_only=showtimes_only,
+                                             logger=logger):
+        if on_result is not None:
+            on_result(movie_details)
+        scraped[movie_details['href']] = movie_details
+    all_movies_details = [scraped[href] for href in movie_hrefs if href in scraped]
+    for movie_details in all_movies_details:
+        print(movie_details)
+    return all_movies_details
+
+
+async def scrape_movies_pipelined(scraper, movie_hrefs, logger, workers, imdb_workers, imdb_rate=1.0,
+                                  on_result=None):
+    """Scrape Showcase pages and enrich them with IMDb data in two overlapping stages.
+
+    Showcase records are queued as soon as they are scraped; an ImdbEnricher with
+    its own WebDriver sessions, concurrency limit and rate limiter fills in the
+    IMDb fields. Records whose enrichment fails are kept without IMDb data.
+    """
+    loop = asyncio.get_running_loop()
+    records = asyncio.Queue()
+    total = len(movie_hrefs)
+    positions = {href: idx for idx, href in enumerate(movie_hrefs, 1)}
+    showcase_pool = ScraperPool.from_scraper(scraper, max(1, min(workers, total)))
+    imdb_pool = ScraperPool.from_scraper(scraper, imdb_workers, include_scraper=False)
+
+    def scrape(worker, href, attempts):
+        logger.info(f"Scraping movie {positions[href]}/{total}: {href}")
+        with tracer.movie(href):
+            movie_info, director = worker.scrape_showcase_details_with_retry(href, attempts)
+        loop.call_soon_threadsafe(records.put_nowait, (movie_info, director))
+        return movie_info
+
+    def produce():
+        try:
+            return showcase_pool.map_with_retry_pass(scrape, movie_hrefs, logger)
+        finally:
+            loop.call_soon_threadsafe(records.put_nowait, None)
+
+    def enrich(movie_info, director):
+        with imdb_pool.acquire() as worker, tracer.movie(movie_info['href']):
+            return worker.scrape_imdb_fields(movie_info['original_title'], director, movie_info['duration'])
+
+    enricher = ImdbEnricher(enrich, MovieScraper.missing_imdb_fields, concurrency=imdb_workers, rate=imdb_rate,
+                            on_done=on_result)
+    try:
+        all_movies_details, _ = await asyncio.gather(loop.run_in_executor(None, produce), enricher.run(records))
+    finally:
+        showcase_pool.close()
+        imdb_pool.close()
+
+    for movie_details in all_movies_details:
+        print(movie_details)
+    return all_movies_details
+
+
+MIN_SUCCESS_RATE = 0.5  # Don't save if less than 50% of movies scraped successfully
+
+def log_selenium_fallbacks(movies, logger):
+    """Log how many movies needed the browser for the whole page or for showtimes."""
+    page = sum(1 for movie in movies if 'page' in movie.get('selenium_fallback', []))
+    showtimes = sum(1 for movie in movies if 'showtimes' in movie.get('selenium_fallback', []))
+    logger.info(f"Selenium fallback: {page} full pages, {showtimes} showtime grids, "
+                f"{len(movies) - page - showtimes} movies over HTTP only.")
+
+
+def log_host_health(logger):
+    """Log per-host successes, failures and circuit breaker trips for the run."""
+    for host, health in host_health.snapshot().items():
+        logger.info(f"Host {host}: {health['successes']} ok, {health['failures']} failed, "
+                    f"circuit opened {health['times_opened']} times.")
+
+
+def run_heavy_scraping(scraper, base_url, logger, workers=1, imdb_workers=0):
+    """Run full scraping: titles, details, showtimes, and IMDb data.
+
+    With a journal on the scraper, each completed movie is journaled; with
+    `scraper.resume`, movies already journaled for the same listing are not
+    scraped again.
+    """
+    movie_hrefs = scraper.scrape_movie_data(base_url)
+    journal = scraper.journal
+    done = journal.start(hash_hrefs(movie_hrefs), resume=scraper.resume) if journal is not None else {}
+    pending = [href for href in movie_hrefs if href not in done]
+    scraped = scrape_movies(scraper, pending, logger, workers=workers, imdb_workers=imdb_workers,
+                            on_result=journal.append if journal is not None else None)
+    scraped = {**done, **{movie['href']: movie for movie in scraped}}
+    all_movies_details = [scraped[href] for href in movie_hrefs if href in scraped]
 
     success_rate = len(all_movies_details) / len(movie_hrefs) if movie_hrefs else 0
     logger.info(f"Scraping completed. {len(all_movies_details)}/{len(movie_hrefs)} movies scraped successfully ({success_rate:.0%}).")
+    log_selenium_fallbacks(all_movies_details, logger)
+    
+    log_host_health(logger)
     
     if success_rate < MIN_SUCCESS_RATE:
         logger.error(f"ABORTING SAVE: Success rate {success_rate:.0%} is below minimum {MIN_SUCCESS_RATE:.0%}. Data.json NOT updated to prevent data loss.")
+        if journal is not None:
+            journal.close()
         return False
     
+    scraper.save_data_to_json(all_movies_details)
+    if journal is not None:
+        journal.discard()
+    logger.info("Data saved successfully.")
+    return True
+
+
+def run_streaming_scraping(scraper, base_url, logger, workers=1, imdb_workers=0, ndjson=None, compact_json=None,
+                           save_data_json=True):
+    """Heavy run that hands every record to the sinks as soon as it is scraped.
+
+    Records are not kept in memory except by the data.json sink. IMDb data is
+    scraped inline with each movie; `imdb_workers` is not used here.
+    """
+    movie_hrefs = scraper.scrape_movie_data(base_url)
+    sinks = []
+    if ndjson:
+        sinks.append(NdjsonSink(ndjson))
+    if compact_json:
+        sinks.append(CompactJsonSink(compact_json))
+    if save_data_json:
+        sinks.append(DataJsonSink(scraper.save_data_to_json, movie_hrefs))
+
+    scraped = 0
+    success = False
+    try:
+        for record in scraper.iter_movies(movie_hrefs, workers=workers, logger=logger):
+            for sink in sinks:
+                sink.write(record)
+            scraped += 1
+
+        success_rate = scraped / len(movie_hrefs) if movie_hrefs else 0
+        logger.info(f"Streaming scraping completed. {scraped}/{len(movie_hrefs)} movies scraped successfully ({success_rate:.0%}).")
+        log_host_health(logger)
+        success = success_rate >= MIN_SUCCESS_RATE
+        if not success:
+            logger.error(f"ABORTING SAVE: Success rate {success_rate:.0%} is below minimum {MIN_SUCCESS_RATE:.0%}. Data.json NOT updated to prevent data loss.")
+    finally:
+        for sink in sinks:
+            sink.close(success)
+    return success
+
+
+RATINGS_REFRESH_WORKERS = 8
+
+
+def refresh_movie_ratings(movie, fields):
+    """Apply freshly fetched IMDb fields to a movie record; returns the names of the fields that changed.
+
+    Ratings are only taken when the fetched runtime matches the Showcase
+    duration, like the full scrape; fields missing from the page keep their
+    current values.
+    """
+    fields = dict(fields)
+    if 'imdb_duration' in fields:
+        try:
+            imdb_minutes = convert_imdb_duration_to_minutes(fields['imdb_duration'])
+            showcase_minutes = convert_showcase_duration_to_minutes(movie['duration'])
+            duration_ok = abs(imdb_minutes - showcase_minutes) <= DURATION_TOLERANCE_MINUTES
+        except (ValueError, AttributeError, IndexError, KeyError):
+            duration_ok = False
+        if not duration_ok:
+            fields.pop('imdb_rating', None)
+            fields.pop('metascore', None)
+    changed = [field for field, value in fields.items() if movie.get(field) != value]
+    movie.update(fields)
+    return changed
+
+
+def run_ratings_refresh(scraper, logger, workers=RATINGS_REFRESH_WORKERS):
+    """Refresh rating, Metascore and runtime of the movies in data.json over HTTP, without a browser.
+
+    Only movies with a resolved IMDb title URL are fetched. Stale-while-revalidate:
+    the stored values stay published until a fetch succeeds, and a failed
+    fetch leaves them as they are.
+    """
+    movies = scraper.get_existing_movies()
+    resolved = [movie for movie in movies if movie.get('imdb_url', '').startswith(f'{IMDB_BASE_URL}/title/tt')]
+    logger.info(f"Refreshing IMDb ratings of {len(resolved)}/{len(movies)} movies over HTTP...")
+
+    backend = HttpImdbBackend()
+    updated = failed = 0
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for movie, fields in zip(resolved, executor.map(lambda movie: backend.fetch_title(movie['imdb_url']),
+                                                            resolved)):
+                if not fields:
+                    failed += 1
+                    logger.warning(f"Keeping stale IMDb fields for {movie['href']}")
+                    continue
+                changed = refresh_movie_ratings(movie, fields)
+                if changed:
+                    updated += 1
+                    logger.info(f"Updated {', '.join(changed)} for {movie['title']}")
+    finally:
+        backend.close()
+
+    logger.info(f"Ratings refresh completed: {updated} updated, {failed} kept stale, "
+                f"{len(resolved) - updated - failed} unchanged.")
+    if updated:
+        scraper.save_data_to_json(movies)
+    return updated
+
+
+SHOWTIME_PROBE_WORKERS = 8
+
+
+def run_showtime_probe(scraper, logger, workers=1, probe_workers=SHOWTIME_PROBE_WORKERS,
+                       report_path='showtime_diff.json'):
+    """Probe the showtimes of the movies in data.json over HTTP and patch only the ones that changed.
+
+    Each page's showing days and static grid are compared with the stored
+    record. A complete probe (a page with a single showing day) is applied as
+    is; a differing multi-day page gets its showtimes refreshed in the browser.
+    A multi-day page that matches is only verified for its showing days and
+    first day, so it is reported as unverified rather than unchanged. Failed
+    probes keep the stored showtimes. Writes a diff report of the changes to
+    `report_path` and returns the number of movies patched.
+    """
+    movies = scraper.get_existing_movies()
+    logger.info(f"Probing the showtimes of {len(movies)} movies over HTTP...")
+    backend = HttpMovieBackend()
+    try:
+        with ThreadPoolExecutor(max_workers=probe_workers) as executor:
+            probes = list(executor.map(lambda movie: backend.probe_showtimes(movie['href']), movies))
+    finally:
+        backend.close()
+
+    updates, refresh, unverified, failed = {}, [], [], 0
+    for movie, probe in zip(movies, probes):
+        if probe is None:
+            failed += 1
+            logger.warning(f"Showtime probe failed for {movie['href']}; keeping the stored showtimes")
+        elif probe_changed(movie, probe):
+            if probe['complete']:
+                updates[movie['href']] = probe
+            else:
+                refresh.append(movie['href'])
+        elif not probe['complete']:
+            unverified.append({'href': movie['href'], 'title': movie.get('title')})
+    if refresh:
+        logger.info(f"Refreshing the showtimes of {len(refresh)} multi-day movies in the browser...")
+        refreshed = scrape_movies(scraper, refresh, logger, workers=workers, showtimes_only=True)
+        updates.update({movie['href']: movie for movie in refreshed})
+        failed += len(refresh) - len(refreshed)
+
+    changes = []
+    for movie in movies:
+        update = updates.get(movie['href'])
+        if update is None:
+            continue
+        diff = diff_showtimes(movie, update)
+        if not (diff['added_days'] or diff['removed_days'] or diff['days']):
+            continue
+        movie['showing_days'] = update['showing_days']
+        movie['showtimes'] = update['showtimes']
+        changes.append({'href': movie['href'], 'title': movie.get('title'), **diff})
+        logger.info(f"Showtimes changed for {movie.get('title')}: {len(diff['added_days'])} days added, "
+                    f"{len(diff['removed_days'])} removed, {len(diff['days'])} with different times.")
+
+    write_diff_report(report_path, changes, probed=len(movies), failed=failed, unverified=unverified)
+    logger.info(f"Showtime probe completed: {len(changes)} changed, {failed} kept stale, "
+                f"{len(movies) - len(changes) - failed - len(unverified)} unchanged, {len(unverified)} multi-day "
+                f"movies unverified after their first day.")
+    if changes:
+        scraper.save_data_to_json(movies)
+    return len(changes)
+
+
+def run_incremental_scraping(scraper, base_url, logger, workers=1, imdb_workers=0):
+    """Re-scrape only what changed: full details for new hrefs, showtimes for kept ones.
+
+    Removed hrefs are dropped and kept movies reuse their stored IMDb fields.
+    """
+    movie_hrefs = scraper.scrape_movie_data(base_url)
+    existing = {movie.get('href'): movie for movie in scraper.get_existing_movies()}
+
+    added = [href for href in movie_hrefs if href not in existing]
+    kept = [href for href in movie_hrefs if href in existing]
+    removed = set(existing) - set(movie_hrefs)
+    logger.info(f"Incremental scraping: {len(added)} new, {len(kept)} kept, {len(removed)} removed.")
+
+    new_movies = {movie['href']: movie
+                  for movie in scrape_movies(scraper, added, logger, workers=workers, imdb_workers=imdb_workers)}
+    refreshed = {movie['href']: movie
+                 for movie in scrape_movies(scraper, kept, logger, workers=workers, showtimes_only=True)}
+
+    all_movies_details = []
+    for href in movie_hrefs:
+        if href in new_movies:
+            all_movies_details.append(new_movies[href])
+        elif href in refreshed:
+            all_movies_details.append({**existing[href], **refreshed[href]})
+
+    success_rate = len(all_movies_details) / len(movie_hrefs) if movie_hrefs else 0
+    logger.info(f"Incremental scraping completed. {len(all_movies_details)}/{len(movie_hrefs)} movies up to date ({success_rate:.0%}).")
+    log_selenium_fallbacks(all_movies_details, logger)
+    log_host_health(logger)
+
+    if success_rate < MIN_SUCCESS_RATE:
+        logger.error(f"ABORTING SAVE: Success rate {success_rate:.0%} is below minimum {MIN_SUCCESS_RATE:.0%}. Data.json NOT updated to prevent data loss.")
+        return False
+
     scraper.save_data_to_json(all_movies_details)
     logger.info("Data saved successfully.")
     return True
 
 
+def hash_hrefs(hrefs):
+    """A stable fingerprint of a listing's movie hrefs."""
+    return hashlib.sha256("\n".join(sorted(hrefs)).encode('utf-8')).hexdigest()
+
+
+def load_listing_fingerprint():
+    """Load the stored listing fingerprint (ETag, Last-Modified and hrefs hash)."""
+    if not LISTING_FINGERPRINT_PATH.exists():
+        return {}
+    try:
+        with open(LISTING_FINGERPRINT_PATH, 'r') as f:
+            return json.load(f)
+    except json.JSONDecodeError:
+        return {}
+
+
+def save_listing_fingerprint(fingerprint):
+    with open(LISTING_FINGERPRINT_PATH, 'w') as f:
+        json.dump(fingerprint, f, indent=4)
+
+
+def film_id(href):
+    """The venue-independent film id of a Showcase movie href."""
+    film_ids = parse_qs(urlparse(href).query).get('filmid')
+    return film_ids[0] if film_ids else href
+
+
+def load_cinemas(cinema_ids=None, cinemas_file=None):
+    """Build the cinema list from repeated --cinema ids and/or a JSON file.
+
+    The file holds a list of ids or of {"id": ..., "name": ...} objects.
+    """
+    cinemas = []
+    if cinemas_file:
+        with open(cinemas_file, 'r') as f:
+            for entry in json.load(f):
+                if isinstance(entry, dict):
+                    cinemas.append({'id': str(entry['id']), 'name': entry.get('name', str(entry['id']))})
+                else:
+                    cinemas.append({'id': str(entry), 'name': str(entry)})
+    for cinema_id in cinema_ids or []:
+        if all(cinema['id'] != cinema_id for cinema in cinemas):
+            cinemas.append({'id': cinema_id, 'name': cinema_id})
+    return cinemas
+
+
+# Browser sessions used for the listings the static HTML does not have.
+LISTING_SESSIONS = 4
+
+
+def run_multi_cinema_scraping(scraper, base_url, cinemas, logger, workers=1, imdb_workers=0):
+    """Scrape several cinemas, resolving each film (and its IMDb data) only once.
+
+    Every listing is read from a single HTTP fetch of the listing page; cinemas
+    missing from its static HTML are scraped in the browser concurrently, on up
+    to LISTING_SESSIONS sessions (or `workers`, if more). The first venue showing
+    a film gets a full scrape; the others only refresh their venue-specific
+    showtimes. Writes one shard per cinema and a combined index; data.json keeps
+    the first cinema.
+    """
+    found = scraper.fetch_cinema_listings(base_url, [cinema['id'] for cinema in cinemas])
+    missing = [cinema for cinema in cinemas if cinema['id'] not in found]
+    if missing:
+        logger.info(f"Scraping the listings of {len(missing)} cinemas in the browser...")
+        listing_pool = ScraperPool.from_scraper(scraper, min(len(missing), max(workers, LISTING_SESSIONS)))
+        try:
+            for cinema, hrefs, error in listing_pool.map(
+                    lambda worker, cinema: worker.scrape_movie_data(base_url, cinema['id']), missing):
+                if error is not None:
+                    logger.error(f"Failed to scrape listing of cinema {cinema['id']}: {error}")
+                    continue
+                found[cinema['id']] = hrefs
+        finally:
+            listing_pool.close()
+    listings = {}
+    for cinema in cinemas:
+        if cinema['id'] in found:
+            logger.info(f"Cinema {cinema['id']}: {len(found[cinema['id']])} movies")
+            listings[cinema['id']] = found[cinema['id']]
+
+    # The first href seen for each film gets the full scrape; the rest only showtimes.
+    primary_hrefs = {}
+    for hrefs in listings.values():
+        for href in hrefs:
+            primary_hrefs.setdefault(film_id(href), href)
+    primary = set(primary_hrefs.values())
+    secondary_hrefs = [href for hrefs in listings.values() for href in hrefs if href not in primary]
+    logger.info(f"{len(primary_hrefs)} distinct films, {len(secondary_hrefs)} extra venue listings.")
+
+    films = {film_id(movie['href']): movie
+             for movie in scrape_movies(scraper, list(primary_hrefs.values()), logger,
+                                        workers=workers, imdb_workers=imdb_workers)}
+    venue_showtimes = {movie['href']: movie
+                       for movie in scrape_movies(scraper, secondary_hrefs, logger,
+                                                  workers=workers, showtimes_only=True)}
+    venue_showtimes.update({movie['href']: movie for movie in films.values()})
+
+    success_rate = len(films) / len(primary_hrefs) if primary_hrefs else 0
+    logger.info(f"Scraping completed. {len(films)}/{len(primary_hrefs)} films scraped successfully ({success_rate:.0%}).")
+    if not listings or success_rate < MIN_SUCCESS_RATE:
+        logger.error(f"ABORTING SAVE: Success rate {success_rate:.0%} is below minimum {MIN_SUCCESS_RATE:.0%}. Data.json NOT updated to prevent data loss.")
+        return False
+
+    shards = {}
+    index_movies = {}
+    for cinema_id, hrefs in listings.items():
+        shards[cinema_id] = []
+        for href in hrefs:
+            film = films.get(film_id(href))
+            showtimes = venue_showtimes.get(href)
+            if film is None or showtimes is None:
+                continue
+            venue = {key: showtimes[key] for key in ('href', 'showing_days', 'showtimes')}
+            shards[cinema_id].append({**film, **venue})
+            combined = index_movies.setdefault(film_id(href), {**film, 'cinemas': {}})
+            combined['cinemas'][cinema_id] = venue
+
+    index = {
+        'cinemas': [{**cinema, 'file': f"{cinema['id']}.json", 'movies': len(shards[cinema['id']])}
+                    for cinema in cinemas if cinema['id'] in shards],
+        'movies': list(index_movies.values()),
+    }
+    scraper.save_cinema_shards(shards, index)
+    scraper.save_data_to_json(shards[next(iter(shards))])
+    logger.info(f"Data saved for {len(shards)} cinemas.")
+    return True
+
+
 def run_light_scraping(scraper, base_url, logger):
     """Light scraping: check if movie hrefs have changed. Returns True if heavy scraping is needed."""
     logger.info("Running light scraping - checking for changes...")
     
     current_hrefs = scraper.scrape_movie_hrefs_only(base_url)
-    existing_hrefs = MovieScraper.get_existing_hrefs()
+    existing_hrefs = scraper.get_existing_hrefs()
     
     logger.info(f"Current movies: {len(current_hrefs)}")
     logger.info(f"Existing movies: {len(existing_hrefs)}")
@@ -513,12 +1452,119 @@ def run_light_scraping(scraper, base_url, logger):
         return False
 
 
+def make_daemon_cycle(scraper, base_url, logger, run_scraping, workers=1, imdb_workers=0,
+                      full_every_seconds=24 * 60 * 60, max_session_age_seconds=DEFAULT_MAX_SESSION_AGE_SECONDS,
+                      max_session_memory_mb=DEFAULT_MAX_SESSION_MEMORY_MB, probe_showtimes=False):
+    """Build the daemon's cycle: recycle over-budget browsers, run the light check and scrape on changes.
+
+    A full run also happens every `full_every_seconds` even without listing
+    changes, since showtimes change while the listing stays the same. With
+    `probe_showtimes`, the cycles in between probe and patch showtimes.
+    """
+    last_full_run = {'at': None}
+
+    def cycle():
+        recycled = scraper.recycle_over_budget(max_session_age_seconds, max_session_memory_mb)
+        due = last_full_run['at'] is None or time.monotonic() - last_full_run['at'] >= full_every_seconds
+        changed = run_light_scraping(scraper, base_url, logger)
+        saved = None
+        patched = 0
+        if changed or due:
+            if not changed:
+                logger.info("Full refresh due.")
+            saved = run_scraping(scraper, base_url, logger, workers=workers, imdb_workers=imdb_workers)
+            last_full_run['at'] = time.monotonic()
+            if scraper.imdb_cache is not None:
+                scraper.imdb_cache.save()
+        elif probe_showtimes:
+            patched = run_showtime_probe(scraper, logger, workers=workers)
+        return {
+            'listing_changed': changed,
+            'scraped': changed or due,
+            'saved': saved,
+            'showtimes_patched': patched,
+            'recycled_sessions': recycled,
+            'warm_sessions': 1 + len(scraper.spare_sessions),
+            'browser_memory_mb': scraper.driver_memory_mb(),
+            'movies': len(scraper.get_existing_hrefs()),
+            'hosts': host_health.snapshot(),
+        }
+
+    return cycle
+
+
 if __name__ == "__main__":
     # Argument parser setup
     parser = argparse.ArgumentParser(description='Scrape movie showtimes.')
     parser.add_argument('--chromedriver-path', type=str, help='Path to the ChromeDriver executable')
     parser.add_argument('--light', action='store_true', help='Run light scraping (titles only). Triggers heavy scraping if changes detected.')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Only fully scrape new movies and refresh showtimes of the rest (also used when --light detects changes).')
+    parser.add_argument('--cinema', action='append', dest='cinemas', metavar='ID',
+                        help='Scrape this Showcase cinema id (repeatable); with several cinemas, writes per-cinema shards.')
+    parser.add_argument('--cinemas-file', type=str,
+                        help='JSON file listing the cinemas to scrape (ids or {"id", "name"} objects).')
+    parser.add_argument('--backend', choices=BACKENDS, default='http',
+                        help='Fetch movie pages over HTTP first (default) or always use Selenium.')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Number of WebDriver sessions used to scrape movies in parallel.')
+    parser.add_argument('--imdb-workers', type=int, default=0,
+                        help='Enrich movies with IMDb data in a separate pipelined stage with this many sessions (0 = inline).')
+    parser.add_argument('--report', action='store_true',
+                        help='Time each phase and write a JSON run report to scraper_report.json.')
+    parser.add_argument('--trace', action='store_true',
+                        help='With --report, also write a Chrome trace-format file to scraper_trace.json.')
+    parser.add_argument('--imdb-cache', choices=CACHE_MODES, default='use',
+                        help='Use the IMDb resolution cache (default), bypass it, or rebuild it from scratch.')
+    parser.add_argument('--daemon', action='store_true',
+                        help='Run as a service: keep browsers warm, run the light check every --interval minutes '
+                             'and scrape (incrementally with --incremental) when the listing changes.')
+    parser.add_argument('--interval', type=float, default=DEFAULT_INTERVAL_SECONDS / 60,
+                        help='With --daemon, minutes between light checks.')
+    parser.add_argument('--full-every', type=float, default=24,
+                        help='With --daemon, hours between full runs even if the listing did not change.')
+    parser.add_argument('--status-port', type=int, default=DEFAULT_STATUS_PORT,
+                        help='With --daemon, local port of the JSON status endpoint (0 disables it).')
+    parser.add_argument('--recycle-after', type=float, default=DEFAULT_MAX_SESSION_AGE_SECONDS / 60,
+                        help='With --daemon, restart browsers older than this many minutes.')
+    parser.add_argument('--recycle-memory-mb', type=float, default=DEFAULT_MAX_SESSION_MEMORY_MB,
+                        help='With --daemon, restart browsers using more memory than this.')
+    parser.add_argument('--ndjson', metavar='TARGET',
+                        help='Stream each movie record as one JSON line to this file, or - for stdout, while scraping.')
+    parser.add_argument('--compact-json', metavar='PATH',
+                        help='Stream the records into a minified JSON array at this path.')
+    parser.add_argument('--no-data-json', action='store_true',
+                        help='With --ndjson or --compact-json, do not write data.json and the bundle.')
+    parser.add_argument('--refresh-ratings', action='store_true',
+                        help='Only refresh IMDb rating, Metascore and runtime of the movies in data.json over HTTP.')
+    parser.add_argument('--probe-showtimes', action='store_true',
+                        help='With --light or --daemon, when the listing is unchanged, probe each movie\'s showtimes '
+                             'over HTTP, patch the ones that changed and write showtime_diff.json.')
+    parser.add_argument('--resume', action='store_true',
+                        help='Skip movies already journaled by an interrupted heavy run of the same listing.')
+    parser.add_argument('--history', nargs='?', const=str(HISTORY_DB_PATH), metavar='PATH',
+                        help='Record each run in the SQLite history store (default path: docs/history.sqlite) '
+                             'and export data.json from it.')
+    parser.add_argument('--imdb-index', nargs='?', const=str(INDEX_PATH), metavar='PATH',
+                        help='Match IMDb titles against the offline index built by imdb_index.py '
+                             '(default path: scraper/imdb_index.sqlite) before searching IMDb.')
+    parser.add_argument('--lean-browser', action='store_true',
+                        help='Use eager page loads and block images, fonts, media and trackers in Chrome.')
+    parser.add_argument('--block', action='append', choices=sorted(BLOCKED_RESOURCES), metavar='TYPE',
+                        help=f'With --lean-browser, resource types to block (repeatable; default: '
+                             f'{", ".join(DEFAULT_BLOCKED_TYPES)}; also: stylesheet).')
+    parser.add_argument('--allow-url', action='append', default=[], metavar='PATTERN',
+                        help='With --lean-browser, URL glob pattern that must keep loading (repeatable).')
     args = parser.parse_args()
+    if args.cinemas or args.cinemas_file:
+        # The multi-cinema run is always a full scrape written to per-cinema shards.
+        unsupported = [flag for flag, value in (
+            ('--light', args.light), ('--incremental', args.incremental), ('--ndjson', args.ndjson),
+            ('--compact-json', args.compact_json), ('--probe-showtimes', args.probe_showtimes),
+            ('--resume', args.resume), ('--daemon', args.daemon), ('--refresh-ratings', args.refresh_ratings),
+        ) if value]
+        if unsupported:
+            parser.error(f"--cinema/--cinemas-file cannot be combined with {', '.join(unsupported)}")
 
     # Configure logging to both file and stdout (useful for CI)
     logging.basicConfig(
@@ -526,20 +1572,62 @@ if __name__ == "__main__":
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         handlers=[
             logging.FileHandler('scraper.log', mode='a'),
-            logging.StreamHandler(sys.stdout)
+            # Keep stdout clean for records when streaming NDJSON to it.
+            logging.StreamHandler(sys.stderr if args.ndjson == '-' else sys.stdout)
         ]
     )
 
     logger = logging.getLogger(__name__)
-    scraper = MovieScraper(chromedriver_path=args.chromedriver_path)
+    if args.report:
+        tracer.enable(keep_events=args.trace)
+    imdb_cache = ImdbCache(IMDB_CACHE_PATH, mode=args.imdb_cache)
+    browser_profile = BrowserProfile(lean=args.lean_browser, allow=args.allow_url,
+                                     block_types=args.block or DEFAULT_BLOCKED_TYPES)
+    imdb_index = ImdbIndex(args.imdb_index) if args.imdb_index else None
+    history = HistoryStore(args.history) if args.history else None
+    scraper = MovieScraper(chromedriver_path=args.chromedriver_path, backend=args.backend, imdb_cache=imdb_cache,
+                           browser_profile=browser_profile, imdb_index=imdb_index, history=history)
+    scraper.journal = RunJournal(JOURNAL_PATH)
+    scraper.resume = args.resume
     base_url = 'https://www.todoshowcase.com/'
 
+    cinemas = load_cinemas(args.cinemas, args.cinemas_file)
+
     try:
-        if args.light:
+        run_scraping = run_incremental_scraping if args.incremental else run_heavy_scraping
+        if args.ndjson or args.compact_json:
+            run_scraping = functools.partial(run_streaming_scraping, ndjson=args.ndjson,
+                                             compact_json=args.compact_json, save_data_json=not args.no_data_json)
+        if args.refresh_ratings:
+            run_ratings_refresh(scraper, logger)
+        elif args.daemon:
+            scraper.keep_warm = True
+            cycle = make_daemon_cycle(scraper, base_url, logger, run_scraping,
+                                      workers=args.workers, imdb_workers=args.imdb_workers,
+                                      full_every_seconds=args.full_every * 60 * 60,
+                                      max_session_age_seconds=args.recycle_after * 60,
+                                      max_session_memory_mb=args.recycle_memory_mb,
+                                      probe_showtimes=args.probe_showtimes)
+            ScraperDaemon(cycle, interval_seconds=args.interval * 60, status_port=args.status_port).serve_forever()
+        elif cinemas:
+            run_multi_cinema_scraping(scraper, base_url, cinemas, logger,
+                                      workers=args.workers, imdb_workers=args.imdb_workers)
+        elif args.light:
             needs_heavy = run_light_scraping(scraper, base_url, logger)
             if needs_heavy:
-                run_heavy_scraping(scraper, base_url, logger)
+                run_scraping(scraper, base_url, logger, workers=args.workers, imdb_workers=args.imdb_workers)
+            elif args.probe_showtimes:
+                run_showtime_probe(scraper, logger, workers=args.workers)
         else:
-            run_heavy_scraping(scraper, base_url, logger)
+            run_scraping(scraper, base_url, logger, workers=args.workers, imdb_workers=args.imdb_workers)
     finally:
+        imdb_cache.save()
         scraper.close()
+        scraper.journal.close()
+        if history is not None:
+            history.close()
+        if args.report:
+            # Written next to scraper.log
+            tracer.write_report('scraper_report.json')
+            if args.trace:
+                tracer.write_chrome_trace('scraper_trace.json')
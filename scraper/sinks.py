@@ -0,0 +1,71 @@
+"""Record sinks for streaming runs: NDJSON, a compact JSON array and the data.json exporter.
+
+Every sink has two methods: `write(record)`, called for every movie as soon as
+it is scraped, and `close(success=True)`, called once at the end; `success` is
+False when the run fell below the minimum success rate, so sinks that replace
+published files leave them alone.
+"""
+import json
+import os
+import sys
+from pathlib import Path
+
+
+class NdjsonSink:
+    """One JSON object per line, flushed per record, to a file or `-` for stdout (pipes included)."""
+
+    def __init__(self, target):
+        self.target = target
+        self._file = sys.stdout if target == '-' else open(target, 'w', encoding='utf-8')
+
+    def write(self, record):
+        self._file.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n')
+        self._file.flush()
+
+    def close(self, success=True):
+        # NDJSON is a log of what was scraped; it is kept even for a failed run.
+        if self._file is not sys.stdout:
+            self._file.close()
+
+
+class CompactJsonSink:
+    """A minified JSON array written record by record to a temporary file, renamed into place on success."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+        self._file = open(self._tmp_path, 'w', encoding='utf-8')
+        self._file.write('[')
+        self._count = 0
+
+    def write(self, record):
+        self._file.write((',' if self._count else '') + json.dumps(record, ensure_ascii=False, separators=(',', ':')))
+        self._count += 1
+
+    def close(self, success=True):
+        self._file.write(']')
+        self._file.close()
+        if success:
+            os.replace(self._tmp_path, self.path)
+        else:
+            self._tmp_path.unlink(missing_ok=True)
+
+
+class DataJsonSink:
+    """Collect records and hand them to `save` (MovieScraper.save_data_to_json) in listing order.
+
+    data.json and the frontend bundle need the whole listing, so this is the
+    one sink that keeps every record until the end.
+    """
+
+    def __init__(self, save, movie_hrefs):
+        self.save = save
+        self.positions = {href: index for index, href in enumerate(movie_hrefs)}
+        self.records = []
+
+    def write(self, record):
+        self.records.append(record)
+
+    def close(self, success=True):
+        if success:
+            self.save(sorted(self.records, key=lambda record: self.positions.get(record['href'], len(self.positions))))
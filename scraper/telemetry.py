@@ -0,0 +1,129 @@
+"""Lightweight per-phase timing and counters for scraper runs.
+
+Disabled by default: `span()` then returns a shared no-op context manager and
+`count()` returns immediately, so instrumented code pays one attribute check.
+"""
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from urllib.parse import urlparse
+
+
+_NULL_SPAN = nullcontext()
+
+
+def host_of(url):
+    return urlparse(url).netloc or 'unknown'
+
+
+class Tracer:
+    """Collect spans and counters, aggregated per phase, per movie and per host."""
+
+    def __init__(self, enabled=False, keep_events=False):
+        self.enabled = enabled
+        self.keep_events = keep_events
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._start = time.perf_counter()
+        self._started_at = time.time()
+        self.phases = {}
+        self.counters = {}
+        self.hosts = {}
+        self.movies = {}
+        self.events = []
+
+    def enable(self, keep_events=False):
+        self.enabled = True
+        self.keep_events = keep_events
+        self._start = time.perf_counter()
+        self._started_at = time.time()
+
+    @contextmanager
+    def movie(self, href):
+        """Attribute the spans and counters of the enclosed block to a movie."""
+        previous = getattr(self._local, 'movie', None)
+        self._local.movie = href
+        try:
+            yield
+        finally:
+            self._local.movie = previous
+
+    def span(self, name, **args):
+        if not self.enabled:
+            return _NULL_SPAN
+        return self._span(name, args)
+
+    @contextmanager
+    def _span(self, name, args):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._record(name, start, time.perf_counter() - start, args)
+
+    def _record(self, name, start, duration, args):
+        movie = getattr(self._local, 'movie', None)
+        with self._lock:
+            self._add_phase(self.phases, name, duration)
+            if movie is not None:
+                self._add_phase(self.movies.setdefault(movie, {'phases': {}, 'counters': {}})['phases'],
+                                name, duration)
+            if self.keep_events:
+                self.events.append({
+                    'name': name,
+                    'ph': 'X',
+                    'ts': round((start - self._start) * 1e6),
+                    'dur': round(duration * 1e6),
+                    'pid': os.getpid(),
+                    'tid': threading.get_ident(),
+                    'args': {**args, 'movie': movie} if movie else args,
+                })
+
+    @staticmethod
+    def _add_phase(phases, name, duration):
+        phase = phases.setdefault(name, {'count': 0, 'total_s': 0.0, 'max_s': 0.0})
+        phase['count'] += 1
+        phase['total_s'] += duration
+        phase['max_s'] = max(phase['max_s'], duration)
+
+    def count(self, name, url=None, amount=1):
+        """Increment a counter, also attributed to the current movie and to the URL's host."""
+        if not self.enabled:
+            return
+        movie = getattr(self._local, 'movie', None)
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+            if url is not None:
+                host = self.hosts.setdefault(host_of(url), {})
+                host[name] = host.get(name, 0) + amount
+            if movie is not None:
+                counters = self.movies.setdefault(movie, {'phases': {}, 'counters': {}})['counters']
+                counters[name] = counters.get(name, 0) + amount
+
+    def report(self):
+        with self._lock:
+            return {
+                'started_at': self._started_at,
+                'duration_s': time.perf_counter() - self._start,
+                'phases': self.phases,
+                'counters': self.counters,
+                'hosts': self.hosts,
+                'movies': self.movies,
+            }
+
+    def write_report(self, path):
+        with open(path, 'w') as f:
+            json.dump(self.report(), f, indent=4)
+
+    def write_chrome_trace(self, path):
+        """Write the spans in Chrome trace-event format (chrome://tracing, Perfetto)."""
+        with self._lock:
+            events = list(self.events)
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+
+
+# Process-wide tracer, enabled from the command line.
+tracer = Tracer()
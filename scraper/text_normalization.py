@@ -0,0 +1,8 @@
+"""Text folding shared by the scraper, the IMDb cache keys, the offline index and candidate scoring."""
+import unicodedata
+
+
+def strip_accents(text: str) -> str:
+    """Remove diacritics from a piece of text."""
+    normalized = unicodedata.normalize("NFKD", text)
+    return "".join(char for char in normalized if not unicodedata.combining(char))